@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    import ssi
+
+    # **************************************************************************
+
+    # Make output directory ...
+    if not os.path.exists("studyBalticConcentration"):
+        os.mkdir("studyBalticConcentration")
+
+    print("Refreshing \"studyBalticConcentration/catalogue.json\" ...")
+
+    # Load the catalogue of the mirror, refresh it and save it ...
+    catalogue = ssi.loadCatalogue()
+    nDirs = ssi.refreshCatalogue(catalogue)
+    ssi.saveCatalogue(catalogue)
+    print(f" > Listed {nDirs:,d} month directories; the mirror has {len(catalogue['files']):,d} NetCDF files.")
+
+    print("Loading \"studyBalticConcentration/lat.bin\" ...")
+
+    # Load BIN file ...
+    refLat = numpy.fromfile(
+        "studyBalticConcentration/lat.bin",
+        dtype = numpy.float32,
+    )                                                                           # [°]
+
+    print("Loading \"studyBalticConcentration/lon.bin\" ...")
+
+    # Load BIN file ...
+    refLon = numpy.fromfile(
+        "studyBalticConcentration/lon.bin",
+        dtype = numpy.float32,
+    )                                                                           # [°]
+
+    # **************************************************************************
+
+    # Check if the datacube needs making ...
+    if not os.path.exists("studyBalticConcentration/cube.csv"):
+        print("Making \"studyBalticConcentration/cube.csv\" ...")
+
+        # Save empty datacube and empty time index ...
+        with open("studyBalticConcentration/cube.bin", mode = "wb") as fObj:
+            pass
+        with open("studyBalticConcentration/cube.csv", mode = "wt", encoding = "utf-8") as fObj:
+            fObj.write("index,date and time\n")
+
+    print("Loading \"studyBalticConcentration/cube.csv\" ...")
+
+    # Load datacube ...
+    stamps, _ = ssi.loadCube()
+
+    # Discard any partial slice at the end of the datacube (which would be left
+    # behind if this script was interrupted whilst appending a slice) ...
+    os.truncate("studyBalticConcentration/cube.bin", len(stamps) * refLat.size * refLon.size)
+
+    # Convert list to dictionary of the index of each slice (for fast
+    # look-ups) ...
+    index = {stamp : i for i, stamp in enumerate(stamps)}
+
+    # Load manifest and find the version of the code which makes the slices ...
+    # NOTE: The slices only depend on how the NetCDF files are loaded.
+    manifest = ssi.loadManifest()
+    version = ssi.codeVersion(ssi.loadNetCDF)
+
+    # **************************************************************************
+
+    # Initialize counter ...
+    nSlices = 0
+
+    # Open datacube and time index ...
+    with open("studyBalticConcentration/cube.bin", mode = "r+b") as fObjBin, open("studyBalticConcentration/cube.csv", mode = "at", encoding = "utf-8") as fObjCsv:
+        # Loop over NetCDF files ...
+        for stamp, nName in ssi.planNetCDFs(catalogue["files"]):
+            # Skip if it is already known to be corrupt ...
+            if ssi.fileStatus(catalogue, nName) == "corrupt":
+                continue
+
+            # Skip if the slice is up-to-date ...
+            # NOTE: The slice is not a file, it is a slice of the datacube,
+            #       therefore whether it exists is found from the time index.
+            sName = f"studyBalticConcentration/cube.bin:{stamp}"
+            iNames = [
+                nName,
+            ]
+            if not ssi.needsMaking(manifest, sName, iNames, version, catalogue = catalogue, exists = stamp in index):
+                continue
+
+            print(f"{'Overwriting' if stamp in index else 'Appending'} \"{nName}\" ...")
+
+            # Skip if there are errors ...
+            try:
+                # Load NetCDF file ...
+                _, _, conc = ssi.loadNetCDF(nName)                              # [%]
+            except ValueError:
+                print(" > Skipping, error loading NetCDF.")
+                ssi.recordStatus(catalogue, nName, "corrupt")
+                continue
+
+            # Demonstrate how the data is arranged ...
+            assert conc.shape == (1, refLat.size, refLon.size)
+
+            # Record the status of the NetCDF file ...
+            ssi.recordStatus(catalogue, nName, "ok" if conc.max() > 0 else "no ice")
+
+            # Find the slice (appending a new slice after the existing
+            # slices) ...
+            row = index.get(stamp, len(index))
+
+            # Write the slice to the datacube *before* appending its date and
+            # time to the time index ...
+            # NOTE: A NetCDF file which has been downloaded again (e.g., a
+            #       corrected one) overwrites its slice in place.
+            fObjBin.seek(row * refLat.size * refLon.size)
+            fObjBin.write(conc.astype(numpy.int8).tobytes())
+            fObjBin.flush()
+            if stamp not in index:
+                fObjCsv.write(f"{row:d},{stamp}\n")
+                fObjCsv.flush()
+                index[stamp] = row
+
+            # Record the slice in the manifest ...
+            ssi.recordArtefact(manifest, sName, iNames, version)
+            nSlices += 1
+
+            # Save the manifest every so often (so that not much is lost if
+            # this script is interrupted) ...
+            if nSlices % 100 == 0:
+                ssi.saveManifest(manifest)
+
+    # Save the manifest ...
+    ssi.saveManifest(manifest)
+
+    # Save the catalogue ...
+    ssi.saveCatalogue(catalogue)
+
+    # **************************************************************************
+
+    # Load datacube ...
+    stamps, cube = ssi.loadCube()
+
+    print(f"The datacube has {len(stamps):,d} slices ({cube.nbytes / 1024 ** 3:,.1f} GiB).")
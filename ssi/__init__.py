@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+"""
+A Python module containing the functions used by the SSI scripts.
+"""
+
+# Import sub-functions ...
+from .artefactsDigest import artefactsDigest
+from .calcAreaChunk import calcAreaChunk
+from .calcAreas import calcAreas
+from .calcHistogram import calcHistogram
+from .calcPixelArea import calcPixelArea
+from .calcSparseHistogram import calcSparseHistogram
+from .calcWater import calcWater
+from .checkNetCDF import checkNetCDF
+from .classifyPixels import classifyPixels
+from .codeVersion import codeVersion
+from .decodeSparse import decodeSparse
+from .dependencies import dependencies
+from .drawPlot import drawPlot
+from .encodeMp4s import encodeMp4s
+from .encodeSparse import encodeSparse
+from .fileStatus import fileStatus
+from .hashFile import hashFile
+from .indexNetCDFs import indexNetCDFs
+from .initialiseWorker import initialiseWorker
+from .loadCatalogue import loadCatalogue
+from .loadCube import loadCube
+from .loadHistogramIndex import loadHistogramIndex
+from .loadHistograms import loadHistograms
+from .loadManifest import loadManifest
+from .loadNetCDF import loadNetCDF
+from .loadSparse import loadSparse
+from .loadWater import loadWater
+from .makeFrame import makeFrame
+from .makeHistogram import makeHistogram
+from .makeLut import makeLut
+from .makeMap import makeMap
+from .makeOverlay import makeOverlay
+from .makePlotTemplate import makePlotTemplate
+from .makePlots import makePlots
+from .makePyramidLevel import makePyramidLevel
+from .needsMaking import needsMaking
+from .planNetCDFs import planNetCDFs
+from .pngProfile import pngProfile
+from .processNetCDF import processNetCDF
+from .recordArtefact import recordArtefact
+from .recordStatus import recordStatus
+from .reduceMap import reduceMap
+from .refreshCatalogue import refreshCatalogue
+from .regridAreas import regridAreas
+from .renderBase import renderBase
+from .renderMap import renderMap
+from .renderText import renderText
+from .saveCatalogue import saveCatalogue
+from .saveHistogram import saveHistogram
+from .saveManifest import saveManifest
+from .sparseDtype import sparseDtype
+from .verifyNetCDF import verifyNetCDF
+from .writeHistogram import writeHistogram
+from .writeMap import writeMap
+from .writeSparse import writeSparse
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def artefactsDigest(
+    manifest,
+    oNames,
+    /,
+):
+    """Calculate the digest of some artefacts from the manifest
+
+    An artefact which is made from many other artefacts (for example, an MP4
+    which is made from every frame) would otherwise have to list all of them as
+    its inputs, and each of them would then be stat-ed (and maybe hashed) for
+    every such artefact. Instead, this function summarises the artefacts by the
+    version of the code which made each of them and the digests of their
+    inputs, as recorded in the manifest, therefore none of them are read. An
+    artefact which is not in the manifest is hashed instead.
+
+    Parameters
+    ----------
+    manifest : dict
+        the manifest
+    oNames : list of str
+        the names of the artefacts
+
+    Returns
+    -------
+    digest : str
+        the SHA-256 digest of the artefacts
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import os
+
+    # Import sub-functions ...
+    from .hashFile import hashFile
+
+    # **************************************************************************
+
+    # Create hash object ...
+    hObj = hashlib.sha256()
+
+    # Loop over artefacts ...
+    for oName in oNames:
+        # Check if the artefact is not in the manifest ...
+        if oName not in manifest:
+            # Update hash object with the digest of the artefact ...
+            stat = os.stat(oName)
+            hObj.update(repr((oName, hashFile(oName, stat.st_size, stat.st_mtime_ns))).encode("utf-8"))
+            continue
+
+        # Create short-hand ...
+        record = manifest[oName]
+
+        # Update hash object with the version and the digests of the inputs of
+        # the artefact ...
+        # NOTE: The sizes and modification times of the inputs are not used, as
+        #       they can change without the content changing.
+        hObj.update(
+            repr(
+                (
+                    oName,
+                    record["version"],
+                    sorted((iName, record["inputs"][iName]["sha256"]) for iName in record["inputs"]),
+                )
+            ).encode("utf-8")
+        )
+
+    # Return answer ...
+    return hObj.hexdigest()
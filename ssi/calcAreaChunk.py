@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcAreaChunk(
+    iLat0,
+    iLat1,
+    cName,
+    /,
+):
+    """Calculate the area of each pixel in a chunk of rows using Vincenty
+
+    This function is the task which is run (in a worker process) for each chunk
+    of rows by "step0_checkData.py" when it uses the Vincenty formula. It calls
+    :func:`calcPixelArea` for every pixel in the chunk, using the reference
+    latitudes ("refLat") and longitudes ("refLon") and the settings of the
+    Vincenty formula ("eps", "level" and "nIter") which were shared with the
+    worker process by :func:`initialiseWorker`. The chunk is checkpointed (by
+    the worker process, as soon as it is finished) under a temporary name and
+    is only then moved into place, so that an interrupted write is never
+    mistaken for a finished chunk.
+
+    Parameters
+    ----------
+    iLat0 : int
+        the latitude index of the first row of pixels in the chunk
+    iLat1 : int
+        the latitude index of the row of pixels after the chunk
+    cName : str
+        the name of the BIN file of the chunk
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calcPixelArea import calcPixelArea
+    from .shared import SHARED
+
+    # **************************************************************************
+
+    # Create short-hands ...
+    lat = SHARED["refLat"]                                                      # [°]
+    lon = SHARED["refLon"]                                                      # [°]
+
+    # Calculate the area of each pixel in the chunk assuming that the data is
+    # point-wise ...
+    areas = numpy.zeros(
+        (iLat1 - iLat0, lon.size - 1),
+        dtype = numpy.float32,
+    )                                                                           # [km2]
+    for iLat in range(iLat0, iLat1):
+        for iLon in range(lon.size - 1):
+            areas[iLat - iLat0, iLon] = calcPixelArea(
+                lat,
+                lon,
+                iLat,
+                iLon,
+                  eps = SHARED["eps"],
+                level = SHARED["level"],
+                nIter = SHARED["nIter"],
+            )                                                                   # [km2]
+
+    # Save BIN file under a temporary name and move it into place ...
+    areas.tofile(f"{cName}.tmp")
+    os.replace(f"{cName}.tmp", cName)
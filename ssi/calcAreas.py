@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcAreas(
+    lat,
+    lon,
+    /,
+    *,
+    a = 6378137.0,
+    f = 1.0 / 298.257223563,
+):
+    """Calculate the area of the pixels of a regular latitude/longitude grid
+
+    This function calculates the area of each pixel between adjacent grid
+    points, where each pixel is bounded by two parallels and two meridians on
+    an ellipsoid. The area of such a quadrangle has a closed-form solution (it
+    is the difference in the authalic area between the two parallels scaled by
+    the difference in longitude) and, on a regular grid, every pixel in a row
+    only differs by the longitude spacing. Therefore, the area is calculated
+    once per row and once per column and then broadcast to the whole grid.
+
+    Parameters
+    ----------
+    lat : numpy.ndarray
+        the 1D array of the latitudes of the grid points (in degrees)
+    lon : numpy.ndarray
+        the 1D array of the longitudes of the grid points (in degrees)
+    a : float, optional
+        the equatorial radius of the ellipsoid (in metres; default is WGS84)
+    f : float, optional
+        the flattening of the ellipsoid (default is WGS84)
+
+    Returns
+    -------
+    areas : numpy.ndarray
+        the 2D array of the area of each pixel (in km2)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Calculate the polar radius and the eccentricity of the ellipsoid ...
+    b = a * (1.0 - f)                                                           # [m]
+    e = numpy.sqrt(f * (2.0 - f))
+
+    # Calculate the area between the equator and each parallel for one radian
+    # of longitude ...
+    sinLat = numpy.sin(numpy.radians(lat.astype(numpy.float64)))
+    band = b * b * (
+        0.5 * sinLat / (1.0 - e * e * sinLat * sinLat)
+        + numpy.log((1.0 + e * sinLat) / (1.0 - e * sinLat)) / (4.0 * e)
+    )                                                                           # [m2/rad]
+
+    # Calculate the area of each row for one radian of longitude and the width
+    # of each column ...
+    rowAreas = numpy.abs(numpy.diff(band)) / 1.0e6                              # [km2/rad]
+    colWidths = numpy.abs(numpy.diff(numpy.radians(lon.astype(numpy.float64)))) # [rad]
+
+    # Return answer ...
+    return numpy.outer(rowAreas, colWidths)                                     # [km2]
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcHistogram(
+    lvl,
+    iWater,
+    weights,
+    /,
+):
+    """Calculate the area-weighted histogram of sea ice concentration
+
+    This function calculates the total area of water which has each sea ice
+    concentration from 0% to 100% in one vectorised pass. Only the water pixels
+    of the reference map (as found by :func:`calcWater`) are gathered, so the
+    land and the out-of-scope water are skipped entirely. The areas are summed
+    in the same (row-major) order as a nested loop over latitude and longitude,
+    therefore the result is identical to the naive approach, bin for bin.
+
+    Parameters
+    ----------
+    lvl : numpy.ndarray
+        the 2D array of sea ice concentrations (in %)
+    iWater : numpy.ndarray
+        the 1D array of the flat indices of the water pixels
+    weights : numpy.ndarray
+        the 1D array of the area of each water pixel (in km2)
+
+    Returns
+    -------
+    hist : numpy.ndarray
+        the 1D array of the total area which has each concentration (in km2)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert iWater.size == weights.size
+
+    # Gather the water pixels and find the ones which have a concentration in
+    # the histogram ...
+    vals = lvl.ravel()[iWater]                                                  # [%]
+    keep = (vals >= 0) & (vals <= 100)
+
+    # Return answer ...
+    return numpy.bincount(
+        vals[keep].astype(numpy.int64),
+          weights = weights[keep],
+        minlength = 101,
+    )                                                                           # [km2]
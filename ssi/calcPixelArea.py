@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcPixelArea(
+    lat,
+    lon,
+    iLat,
+    iLon,
+    /,
+    *,
+      eps = 1.0e-12,
+    level = 1,
+    nIter = 1000000,
+):
+    """Calculate the area of a single pixel using the Vincenty formula
+
+    This function makes a Polygon of the pixel between the grid points
+    (iLat, iLon) and (iLat + 1, iLon + 1) and calculates its area by iterating
+    the Vincenty formula. It is slow, but it is an independent check of the
+    analytic areas calculated by :func:`calcAreas`.
+
+    Parameters
+    ----------
+    lat : numpy.ndarray
+        the 1D array of the latitudes of the grid points (in degrees)
+    lon : numpy.ndarray
+        the 1D array of the longitudes of the grid points (in degrees)
+    iLat : int
+        the latitude index of the pixel
+    iLon : int
+        the longitude index of the pixel
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    level : int, optional
+        the number of levels to split the pixel into when calculating its area
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+
+    Returns
+    -------
+    area : float
+        the area of the pixel (in km2)
+    """
+
+    # Import special modules ...
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Make the pixel ...
+    pixel = shapely.geometry.polygon.Polygon(
+        shapely.geometry.polygon.LinearRing(
+            [
+                (lon[iLon    ], lat[iLat    ]),
+                (lon[iLon    ], lat[iLat + 1]),
+                (lon[iLon + 1], lat[iLat + 1]),
+                (lon[iLon + 1], lat[iLat    ]),
+                (lon[iLon    ], lat[iLat    ]),
+            ]
+        )
+    )
+
+    # Return answer ...
+    return pyguymer3.geo.area(
+        pixel,
+          eps = eps,
+        level = level,
+        nIter = nIter,
+    ) / 1.0e6                                                                   # [km2]
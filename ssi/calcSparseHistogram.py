@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcSparseHistogram(
+    sparse,
+    iWater,
+    weights,
+    /,
+):
+    """Calculate the area-weighted histogram of a sparse file
+
+    This function does the same as :func:`calcHistogram` but from the records
+    of a sparse file (as loaded by :func:`loadSparse`), so that the NetCDF file
+    does not have to be loaded and decoded. The water pixels which are not in
+    the sparse file have the same concentration as the reference map (i.e.,
+    0%), therefore the records are scattered into a compact 1D array of the
+    water pixels (found with :func:`numpy.searchsorted`, as the flat indices of
+    the water pixels are sorted) and the areas are then summed in the same
+    order as :func:`calcHistogram`, therefore the result is identical to it,
+    bin for bin.
+
+    Parameters
+    ----------
+    sparse : numpy.ndarray
+        the 1D array of records of the sparse file
+    iWater : numpy.ndarray
+        the 1D array of the flat indices of the water pixels
+    weights : numpy.ndarray
+        the 1D array of the area of each water pixel (in km2)
+
+    Returns
+    -------
+    hist : numpy.ndarray
+        the 1D array of the total area which has each concentration (in km2)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert iWater.size == weights.size
+
+    # Find the position of each record in the list of water pixels and only
+    # keep the records which are water pixels ...
+    pos = numpy.searchsorted(iWater, sparse["idx"]).clip(0, iWater.size - 1)
+    isWater = iWater[pos] == sparse["idx"]
+
+    # Make the water pixels ...
+    vals = numpy.zeros(iWater.size, dtype = numpy.int8)                         # [%]
+    vals[pos[isWater]] = sparse["lvl"][isWater]                                 # [%]
+
+    # Find the water pixels which have a concentration in the histogram ...
+    keep = (vals >= 0) & (vals <= 100)
+
+    # Return answer ...
+    return numpy.bincount(
+        vals[keep].astype(numpy.int64),
+          weights = weights[keep],
+        minlength = 101,
+    )                                                                           # [km2]
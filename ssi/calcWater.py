@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcWater(
+    refLvl,
+    pixelAreas,
+    /,
+):
+    """Calculate the index and the area of the water pixels in the reference map
+
+    This function finds the flat indices of the water pixels in the reference
+    map (in row-major order) and the area of each of them, so that the later
+    stages only work on the water pixels, as compact 1D arrays, and skip the
+    land and out-of-scope water entirely.
+
+    Parameters
+    ----------
+    refLvl : numpy.ndarray
+        the 2D array of the reference map (0 for water, -99 for land and -59 for
+        out-of-scope water)
+    pixelAreas : numpy.ndarray
+        the 1D array of the area of a pixel in each row (in km2), or the 2D
+        array of the area of every pixel (in km2), as made by
+        :func:`regridAreas`
+
+    Returns
+    -------
+    iWater : numpy.ndarray
+        the 1D array of the flat indices of the water pixels
+    weights : numpy.ndarray
+        the 1D array of the area of each water pixel (in km2)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .classifyPixels import classifyPixels
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert len(refLvl.shape) == 2
+
+    # Find the water pixels ...
+    iWater = numpy.flatnonzero(classifyPixels(refLvl) == 0).astype(numpy.uint32)
+
+    # Check if there is an area for every pixel ...
+    if len(pixelAreas.shape) == 2:
+        # Check argument ...
+        assert pixelAreas.shape == refLvl.shape
+
+        # Return answer ...
+        return iWater, numpy.asarray(pixelAreas, dtype = numpy.float64).ravel()[iWater] # [km2]
+
+    # Check argument ...
+    assert pixelAreas.shape == (refLvl.shape[0],)
+
+    # Return answer ...
+    return iWater, numpy.asarray(pixelAreas, dtype = numpy.float64)[iWater // refLvl.shape[1]]  # [km2]
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def checkNetCDF(
+    nName,
+    /,
+):
+    """Check a NetCDF file of Baltic sea ice concentration
+
+    This function is the task which is run (in a worker process) for each
+    NetCDF file by "step0_checkData.py". It only returns a digest of the sea
+    ice concentrations, rather than the sea ice concentrations themselves, so
+    that the result is cheap to send back to the main process.
+
+    Parameters
+    ----------
+    nName : str
+        the name of the NetCDF file
+
+    Returns
+    -------
+    result : None, tuple
+        None if the NetCDF file cannot be loaded, otherwise a tuple of: the 1D
+        array of latitudes (in degrees); the 1D array of longitudes (in
+        degrees); whether there is any sea ice; and the SHA-256 digest of the
+        3D array of sea ice concentrations
+    """
+
+    # Import standard modules ...
+    import hashlib
+
+    # Import sub-functions ...
+    from .loadNetCDF import loadNetCDF
+
+    # **************************************************************************
+
+    # Skip if there are errors ...
+    try:
+        # Load NetCDF file ...
+        lat, lon, conc = loadNetCDF(nName)                                      # [°], [°], [%]
+    except ValueError:
+        return None
+
+    # Return answer ...
+    return lat, lon, bool(conc.max() > 0), hashlib.sha256(conc.tobytes()).hexdigest()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def classifyPixels(
+    refLvl,
+    /,
+):
+    """Classify the pixels of the reference map as water, land or out-of-scope
+
+    This function maps every value in the reference map to its class with a
+    single lookup. The classes are also the indices of the palette of
+    "conc.png". Every unexpected value is reported at once, along with how many
+    pixels have it and where the first few of them are.
+
+    Parameters
+    ----------
+    refLvl : numpy.ndarray
+        the array of the reference map (0 for water, -99 for land and -59 for
+        out-of-scope water)
+
+    Returns
+    -------
+    cls : numpy.ndarray
+        the array (of the same shape) of classes (0 for water, 1 for land and 2
+        for out-of-scope water)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert refLvl.dtype == numpy.int8
+
+    # Make a table of the class of every possible value (marking the unexpected
+    # values with 255) ...
+    table = numpy.full(
+        256,
+        255,
+        dtype = numpy.uint8,
+    )
+    table[numpy.array([0, -99, -59], dtype = numpy.int8).view(numpy.uint8)] = [
+        0,                                                                      # water
+        1,                                                                      # land
+        2,                                                                      # out-of-scope water
+    ]
+
+    # Classify the pixels ...
+    cls = table[refLvl.view(numpy.uint8)]
+
+    # Check that the reference map only contains the expected values ...
+    unknown = cls == 255
+    if unknown.any():
+        # Initialize list ...
+        msgs = []
+
+        # Loop over unexpected values ...
+        for val, count in zip(*numpy.unique(refLvl[unknown], return_counts = True), strict = True):
+            # Find the first few pixels which have this value ...
+            locs = numpy.argwhere(refLvl == val)[:5, :]
+            msgs.append(f"{val:d} ({count:,d} pixels, e.g., at {', '.join(str(tuple(loc.tolist())) for loc in locs)})")
+
+        # Crash ...
+        raise ValueError(f"the reference map contains unexpected values: {'; '.join(msgs)}") from None
+
+    # Return answer ...
+    return cls
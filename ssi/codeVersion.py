@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import functools
+
+# Define function ...
+@functools.lru_cache(maxsize = 64)
+def codeVersion(
+    *srcs,
+    **config,
+):
+    """Calculate the version of the code (and configuration) of an artefact
+
+    This function is cached, as the source code does not change during a run.
+
+    Parameters
+    ----------
+    *srcs : str, function, module
+        the names of the source files, or the functions and modules, which make
+        the artefact
+    **config : dict
+        the (hashable) configuration which changes the artefact
+
+    Returns
+    -------
+    version : str
+        the SHA-256 digest of the source code and the configuration
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import inspect
+
+    # **************************************************************************
+
+    # Create hash object ...
+    hObj = hashlib.sha256()
+
+    # Loop over sources ...
+    for src in srcs:
+        # Find the name of the source file ...
+        fname = src if isinstance(src, str) else inspect.getsourcefile(src)
+
+        # Update hash object ...
+        with open(fname, mode = "rb") as fObj:
+            hObj.update(fObj.read())
+
+    # Update hash object ...
+    hObj.update(repr(sorted(config.items())).encode("utf-8"))
+
+    # Return answer ...
+    return hObj.hexdigest()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def decodeSparse(
+    sparse,
+    refLvl,
+    /,
+):
+    """Decode a sparse array as a map of Baltic sea ice concentration
+
+    This function is the inverse of :func:`encodeSparse`.
+
+    Parameters
+    ----------
+    sparse : numpy.ndarray
+        the 1D array of records, with fields "idx" (the flat index of the pixel)
+        and "lvl" (the sea ice concentration of the pixel, in %)
+    refLvl : numpy.ndarray
+        the 2D array of the reference map (0 for water, -99 for land and -59 for
+        out-of-scope water)
+
+    Returns
+    -------
+    lvl : numpy.ndarray
+        the 2D array of sea ice concentrations (in %)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Start with the reference map and then overwrite the pixels which differ
+    # from it ...
+    lvl = refLvl.astype(numpy.int8)                                             # [%]
+    lvl.ravel()[sparse["idx"]] = sparse["lvl"]                                  # [%]
+
+    # Return answer ...
+    return lvl
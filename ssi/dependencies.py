@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def dependencies(
+    kind,
+    nName,
+    /,
+    *,
+    profile = "archival",
+):
+    """Find the dependencies of an artefact which is made from a NetCDF file
+
+    This function is used by every script which makes these artefacts, so that
+    they all agree on when an artefact needs making.
+
+    Parameters
+    ----------
+    kind : str
+        the kind of artefact ("histogram", "map", "pyramid" or "sparse")
+    nName : str
+        the name of the NetCDF file
+    profile : str, optional
+        the name of the PNG encoding profile (which only changes the maps and
+        the levels of the pyramid)
+
+    Returns
+    -------
+    iNames : list of str
+        the names of the inputs of the artefact
+    version : str
+        the version of the code (and configuration) which makes the artefact
+    """
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from .calcHistogram import calcHistogram
+    from .calcSparseHistogram import calcSparseHistogram
+    from .codeVersion import codeVersion
+    from .encodeSparse import encodeSparse
+    from .loadNetCDF import loadNetCDF
+    from .loadSparse import loadSparse
+    from .makeHistogram import makeHistogram
+    from .makeLut import makeLut
+    from .makeMap import makeMap
+    from .makeOverlay import makeOverlay
+    from .makePyramidLevel import makePyramidLevel
+    from .pngProfile import pngProfile
+    from .processNetCDF import processNetCDF
+    from .reduceMap import reduceMap
+    from .renderBase import renderBase
+    from .renderMap import renderMap
+    from .renderText import renderText
+    from .saveHistogram import saveHistogram
+    from .sparseDtype import sparseDtype
+    from .writeMap import writeMap
+    from .writeSparse import writeSparse
+
+    # **************************************************************************
+
+    # Check what kind of artefact it is ...
+    match kind:
+        case "histogram":
+            # Return answer ...
+            return [
+                nName,
+                "studyBalticConcentration/water.bin",
+                "studyBalticConcentration/weights.bin",
+            ], codeVersion(
+                calcHistogram,
+                calcSparseHistogram,
+                loadNetCDF,
+                loadSparse,
+                makeHistogram,
+                processNetCDF,
+                saveHistogram,
+            )
+        case "map":
+            # Return answer ...
+            return [
+                nName,
+                "makeAlphabet.png",
+                "studyBalticConcentration/conc.bin",
+                "studyBalticConcentration/water.bin",
+                f"{pyguymer3.__path__[0]}/data/json/colourTables.json",
+            ], codeVersion(
+                loadNetCDF,
+                makeLut,
+                makeMap,
+                makeOverlay,
+                pngProfile,
+                renderBase,
+                renderMap,
+                renderText,
+                writeMap,
+                profile = profile,
+            )
+        case "pyramid":
+            # Find the dependencies of the map ...
+            # NOTE: The levels of the pyramid are made from the same inputs
+            #       (and by the same code) as the map.
+            iNames, version = dependencies("map", nName, profile = profile)
+
+            # Return answer ...
+            return iNames, codeVersion(
+                makePyramidLevel,
+                reduceMap,
+                map = version,
+            )
+        case "sparse":
+            # Return answer ...
+            return [
+                nName,
+                "studyBalticConcentration/conc.bin",
+            ], codeVersion(
+                encodeSparse,
+                loadNetCDF,
+                processNetCDF,
+                sparseDtype,
+                writeSparse,
+            )
+        case _:
+            # Crash ...
+            raise ValueError(f"\"{kind}\" is not a recognised kind of artefact") from None
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def drawPlot(
+    template,
+    date,
+    equiv,
+    hist,
+    pName,
+    /,
+):
+    """Draw the plot of Baltic sea ice for a day using a template
+
+    This function restores the background which was cached by
+    :func:`makePlotTemplate`, moves the highlight bar to the day, resizes the
+    bars of the histogram and then only draws the artists which change from
+    day to day (and the artists which must be drawn on top of them) before
+    saving the PNG file, in the same way as
+    :meth:`matplotlib.figure.Figure.savefig` would.
+
+    Parameters
+    ----------
+    template : dict
+        the template made by :func:`makePlotTemplate`
+    date : str
+        the date (in "YYYY-MM-DD" format)
+    equiv : float
+        the 100%-concentration equivalent sea ice area on the date (in 10^3
+        km2)
+    hist : numpy.ndarray
+        the 1D array of the total area which has each concentration (in 10^3
+        km2)
+    pName : str
+        the name of the PNG file
+    """
+
+    # Import special modules ...
+    try:
+        import matplotlib
+        import matplotlib.image
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+
+    # **************************************************************************
+
+    # Create short-hand ...
+    fg = template["fg"]
+
+    # Move the highlight bar to the day and resize it ...
+    # NOTE: The dates are categories, therefore the centre of the bar is the
+    #       index of the date.
+    template["highlight"].set_x(template["index"][date] - 0.5 * template["highlight"].get_width())
+    template["highlight"].set_height(equiv)                                     # [10^3 km2]
+
+    # Resize the bars of the histogram ...
+    for rect, y in zip(template["bars"], hist, strict = True):
+        rect.set_height(y)                                                      # [10^3 km2]
+
+    # Restore the background and draw the artists which change on top of it ...
+    fg.canvas.restore_region(template["bg"])
+    for layer, ax in zip(template["layers"], fg.axes, strict = True):
+        for artist in layer:
+            ax.draw_artist(artist)
+
+    # Save figure ...
+    matplotlib.image.imsave(
+        pName,
+        fg.canvas.buffer_rgba(),
+           dpi = fg.dpi,
+        format = "png",
+        origin = "upper",
+    )
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def encodeMp4s(
+    frames,
+    vNames,
+    /,
+    *,
+    debug = __debug__,
+      fps = 25.0,
+):
+    """Encode a sequence of PNG frames as MP4 videos of several sizes at once
+
+    This function decodes each PNG frame only once and pipes its raw RGB pixels
+    into a single "ffmpeg" process, which splits the stream and scales it to
+    each size, rather than running :func:`pyguymer3.media.images2mp4` (which
+    makes "ffmpeg" decode every PNG frame again) once per size. Each MP4 is
+    encoded with the same settings as :func:`pyguymer3.media.images2mp4` and
+    is only moved into place once all of them have been encoded.
+
+    Parameters
+    ----------
+    frames : list of str
+        the names of the PNG frames (which must all be the same size)
+    vNames : dict
+        the size of the square screen (in pixels) which each MP4 is downscaled
+        to fit within (or None if it is not downscaled), keyed by the name of
+        the MP4
+    debug : bool, optional
+        print debug messages (including the output of "ffmpeg")
+    fps : float, optional
+        the framerate
+    """
+
+    # Import standard modules ...
+    import os
+    import shutil
+    import subprocess
+
+    # Import special modules ...
+    try:
+        import PIL
+        import PIL.Image
+        PIL.Image.MAX_IMAGE_PIXELS = 1024 * 1024 * 1024                         # [px]
+    except:
+        raise Exception("\"PIL\" is not installed; run \"pip install --user Pillow\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.media
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Try to find the path ...
+    ffmpegPath = shutil.which("ffmpeg")
+    assert ffmpegPath is not None, "\"ffmpeg\" is not installed"
+
+    # Find the dimensions of the frames (assuming that they are all the same
+    # dimensions) ...
+    with PIL.Image.open(frames[0]) as iObj:
+        inputWidth, inputHeight = iObj.size                                     # [px], [px]
+
+    # Find the dimensions (and aspect ratio) of the cropped frames ...
+    # NOTE: x264 requires that the dimensions are multiples of 2.
+    cropWidth = 2 * (inputWidth // 2)                                           # [px]
+    cropHeight = 2 * (inputHeight // 2)                                         # [px]
+    cropRatio = float(cropWidth) / float(cropHeight)                            # [px/px]
+
+    # Crop the frames and split the stream into one stream per MP4 ...
+    filterParams = [
+        f"[0:v]crop={cropWidth:d}:{cropHeight:d}:{(inputWidth - cropWidth) // 2:d}:{(inputHeight - cropHeight) // 2:d},split={len(vNames):d}" + "".join(f"[s{i:d}]" for i in range(len(vNames))),
+    ]
+
+    # Start the command with the raw RGB frames (which are piped in) ...
+    # NOTE: Audio and subtitle streams are not mapped.
+    cmd = [
+        ffmpegPath,
+        "-hide_banner",
+        "-f", "rawvideo",
+        "-pix_fmt", "rgb24",
+        "-video_size", f"{inputWidth:d}x{inputHeight:d}",
+        "-framerate", f"{fps:.1f}",
+        "-i", "pipe:0",
+    ]
+
+    # Initialize list ...
+    outputs = []
+
+    # Loop over MP4s ...
+    for i, (vName, screenSize) in enumerate(vNames.items()):
+        # Check if the user wants to scale the frames down to fit within a
+        # screen size ...
+        if screenSize is not None:
+            # Check if the cropped frames are wider/taller than the screen
+            # size ...
+            if cropRatio > 1.0:
+                # Find the dimensions of the output video ...
+                outputWidth = screenSize                                        # [px]
+                outputHeight = 2 * (round(float(screenSize) / cropRatio) // 2)  # [px]
+            else:
+                # Find the dimensions of the output video ...
+                outputWidth = 2 * (round(float(screenSize) * cropRatio) // 2)   # [px]
+                outputHeight = screenSize                                       # [px]
+        else:
+            # Find the dimensions of the output video ...
+            outputWidth = cropWidth                                             # [px]
+            outputHeight = cropHeight                                           # [px]
+
+        # Scale the stream (if required) ...
+        if cropWidth != outputWidth or cropHeight != outputHeight:
+            filterParams.append(f"[s{i:d}]scale={outputWidth:d}:{outputHeight:d}[o{i:d}]")
+        else:
+            filterParams.append(f"[s{i:d}]null[o{i:d}]")
+
+        # Find CRF, level and profile of the output video ...
+        crf = pyguymer3.media.return_x264_crf(outputWidth, outputHeight)
+        level = pyguymer3.media.return_x264_level(outputWidth, outputHeight)
+        profile = pyguymer3.media.return_x264_profile(outputWidth, outputHeight)
+
+        # Encode the stream to a temporary MP4 ...
+        tName = f"{vName.removesuffix('.mp4')}.tmp.mp4"
+        outputs += [
+            "-map", f"[o{i:d}]",
+            "-pix_fmt", "yuv420p",
+            "-c:v", "libx264",
+            "-profile:v", profile,
+            "-preset", "veryslow",
+            "-level", level,
+            "-crf", f"{crf:.1f}",
+            "-f", "mp4",
+            "-movflags", "+faststart",
+            "-map_chapters", "-1",
+            "-map_metadata", "-1",
+            "-threads", f"{max(1, (os.cpu_count() or 1) - 1):d}",
+            "-y",
+            tName,
+        ]
+
+    # Finish the command ...
+    cmd += [
+        "-filter_complex", ";".join(filterParams),
+    ] + outputs
+    if debug:
+        print(f'INFO: {" ".join(cmd)}')
+
+    # Start the encoder ...
+    with subprocess.Popen(
+        cmd,
+         stderr = None if debug else subprocess.DEVNULL,
+          stdin = subprocess.PIPE,
+         stdout = subprocess.DEVNULL,
+    ) as proc:
+        # Loop over frames ...
+        for frame in frames:
+            # Open image as RGB (even if it is paletted) ...
+            with PIL.Image.open(frame) as iObj:
+                im = iObj.convert("RGB")
+
+            # Check that it is the same size as the first frame ...
+            if im.size != (inputWidth, inputHeight):
+                proc.kill()
+                raise Exception(f"\"{frame}\" is not the same size as \"{frames[0]}\" ({im.width:,d} px × {im.height:,d} px ≠ {inputWidth:,d} px × {inputHeight:,d} px)") from None
+
+            # Pipe the raw RGB frame into the encoder ...
+            proc.stdin.write(im.tobytes())
+
+        # Tell the encoder that there are no more frames and wait for it to
+        # finish ...
+        proc.stdin.close()
+        proc.wait()
+
+    # Check that the encoder succeeded ...
+    if proc.returncode != 0:
+        raise Exception(f"\"ffmpeg\" failed (it returned {proc.returncode:d}); re-run with debug messages for clues") from None
+
+    # Loop over MP4s ...
+    for vName in vNames:
+        # Optimise the temporary MP4 and move it into place ...
+        tName = f"{vName.removesuffix('.mp4')}.tmp.mp4"
+        pyguymer3.media.optimise_MP4(
+            tName,
+            debug = debug,
+        )
+        os.replace(tName, vName)
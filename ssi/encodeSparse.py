@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def encodeSparse(
+    lvl,
+    refLvl,
+    /,
+):
+    """Encode a map of Baltic sea ice concentration as a sparse array
+
+    This function finds the pixels which differ from the reference map (which
+    are the water pixels which have non-zero sea ice concentrations) and
+    returns their flat indices and their sea ice concentrations as an array of
+    records. As every other pixel is the same as the reference map, the dense
+    map can be recovered exactly by :func:`decodeSparse`.
+
+    Parameters
+    ----------
+    lvl : numpy.ndarray
+        the 2D array of sea ice concentrations (in %)
+    refLvl : numpy.ndarray
+        the 2D array of the reference map (0 for water, -99 for land and -59 for
+        out-of-scope water)
+
+    Returns
+    -------
+    sparse : numpy.ndarray
+        the 1D array of records, with fields "idx" (the flat index of the pixel)
+        and "lvl" (the sea ice concentration of the pixel, in %)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .sparseDtype import sparseDtype
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert lvl.dtype == numpy.int8
+    assert lvl.shape == refLvl.shape
+
+    # Find the pixels which differ from the reference map ...
+    idx = numpy.flatnonzero(lvl != refLvl)
+
+    # Make the array of records ...
+    sparse = numpy.zeros(
+        idx.size,
+        dtype = sparseDtype(),
+    )
+    sparse["idx"] = idx
+    sparse["lvl"] = lvl.ravel()[idx]                                            # [%]
+
+    # Return answer ...
+    return sparse
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def fileStatus(
+    catalogue,
+    nName,
+    /,
+):
+    """Find the status of a NetCDF file from the catalogue
+
+    The status is forgotten by :func:`refreshCatalogue` whenever the size or
+    modification time of the NetCDF file changes, therefore a NetCDF file which
+    has been downloaded again is always decoded again. The NetCDF file is not
+    stat-ed (let alone opened), as the catalogue has just been refreshed; a
+    NetCDF file which is overwritten in place is only noticed once every month
+    directory has been listed again (see the "full" argument of
+    :func:`refreshCatalogue`).
+
+    Parameters
+    ----------
+    catalogue : dict
+        the catalogue (as returned by :func:`loadCatalogue`)
+    nName : str
+        the name of the NetCDF file
+
+    Returns
+    -------
+    status : None, str
+        "corrupt", "no ice" or "ok" (or None if it is not known)
+    """
+
+    # **************************************************************************
+
+    # Create short-hand ...
+    record = catalogue["files"].get(nName)
+
+    # Check if the NetCDF file is not in the catalogue ...
+    if record is None:
+        # Return answer ...
+        return None
+
+    # Return answer ...
+    return record.get("status")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import functools
+
+# Define function ...
+@functools.lru_cache(maxsize = None)
+def hashFile(
+    fname,
+    size,
+    mtime,
+    /,
+):
+    """Calculate the SHA-256 digest of a file
+
+    This function is cached on the name, size and modification time of the
+    file, so that a file which is an input of many artefacts (for example,
+    "conc.bin") is only read once per run. The size and modification time are
+    checked against the file once it has been read, so that a digest is never
+    cached under the size and modification time of a different version of the
+    file.
+
+    Parameters
+    ----------
+    fname : str
+        the name of the file
+    size : int
+        the size of the file (in bytes)
+    mtime : int
+        the modification time of the file (in nanoseconds)
+
+    Returns
+    -------
+    digest : str
+        the SHA-256 digest of the file
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import os
+
+    # **************************************************************************
+
+    # Calculate the digest of the file and check that it is still the version
+    # of the file that the caller found ...
+    with open(fname, mode = "rb") as fObj:
+        digest = hashlib.file_digest(fObj, "sha256").hexdigest()
+        stat = os.fstat(fObj.fileno())
+    if stat.st_size != size or stat.st_mtime_ns != mtime:
+        raise Exception(f"\"{fname}\" changed while it was being hashed") from None
+
+    # Return answer ...
+    return digest
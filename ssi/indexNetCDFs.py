@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def indexNetCDFs(
+    nNames,
+    /,
+):
+    """Index NetCDF files of Baltic sea ice concentration by day
+
+    This function parses the date and time out of the name of each NetCDF file
+    (which is of the form "ice_conc_baltic_YYYYMMDDhhmm.nc") once, so that the
+    scripts do not have to.
+
+    Parameters
+    ----------
+    nNames : iterable of str
+        the names of the NetCDF files
+
+    Returns
+    -------
+    index : dict
+        the NetCDF files for each day (in "YYYY-MM-DD" format), in chronological
+        order, as lists of (date and time (in "YYYY-MM-DD_HH-MM" format), name)
+        tuples (also in chronological order)
+    """
+
+    # Import standard modules ...
+    import os
+    import re
+
+    # **************************************************************************
+
+    # Initialize list ...
+    nFiles = []
+
+    # Loop over NetCDF files ...
+    for nName in nNames:
+        # Parse the date and time out of the name ...
+        match = re.fullmatch(r"ice_conc_baltic_(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})\.nc", os.path.basename(nName))
+        if match is None:
+            raise ValueError(f"\"{nName}\" is not a recognised NetCDF file name") from None
+        yyyy, mm, dd, hh, mi = match.groups()
+
+        # Append the date and time and the name to the list ...
+        nFiles.append((f"{yyyy}-{mm}-{dd}_{hh}-{mi}", nName))
+
+    # Initialize dictionary ...
+    index = {}
+
+    # Loop over NetCDF files (in chronological order) ...
+    for stamp, nName in sorted(nFiles):
+        # Append the NetCDF file to the list for the day ...
+        if stamp[:10] not in index:
+            index[stamp[:10]] = []
+        index[stamp[:10]].append((stamp, nName))
+
+    # Return answer ...
+    return index
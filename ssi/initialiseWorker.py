@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def initialiseWorker(
+    shared,
+    /,
+):
+    """Initialise a worker process in a pool
+
+    This function is the initializer of a :class:`multiprocessing.Pool`. It
+    stores the (read-only) reference arrays in the worker process once, so that
+    they are available to every task which is run in that worker process
+    without being pickled for every single task.
+
+    Parameters
+    ----------
+    shared : dict
+        the reference arrays to share with all of the tasks
+    """
+
+    # Import sub-functions ...
+    from .shared import SHARED
+
+    # **************************************************************************
+
+    # Store the reference arrays ...
+    SHARED.clear()
+    SHARED.update(shared)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadCatalogue(
+    jName = "studyBalticConcentration/catalogue.json",
+    /,
+):
+    """Load the catalogue of the mirror of NetCDF files
+
+    The catalogue is a dictionary of two dictionaries: "dirs", keyed by the
+    name of each month directory, of the modification time of the directory;
+    and "files", keyed by the name of each NetCDF file, of the date and time,
+    size, modification time and status of the NetCDF file. The status is None
+    until the NetCDF file is decoded, after which it is "corrupt", "no ice" or
+    "ok" (see :func:`fileStatus` and :func:`recordStatus`).
+
+    Parameters
+    ----------
+    jName : str, optional
+        the name of the JSON file
+
+    Returns
+    -------
+    catalogue : dict
+        the catalogue (which is empty if the JSON file does not exist)
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # **************************************************************************
+
+    # Check if the JSON file exists ...
+    if not os.path.exists(jName):
+        # Return answer ...
+        return {
+             "dirs" : {},
+            "files" : {},
+        }
+
+    # Return answer ...
+    with open(jName, mode = "rt", encoding = "utf-8") as fObj:
+        return json.load(fObj)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadCube(
+    dname = "studyBalticConcentration",
+    /,
+):
+    """Load the datacube of Baltic sea ice concentration
+
+    This function memory-maps the datacube which is made by "createCube.py".
+    The datacube is a raw binary file of int8 sea ice concentrations shaped
+    (time, lat, lon), which is accompanied by a CSV file which lists the date
+    and time of each slice (in the order that they were appended). No data is
+    copied until a slice is used.
+
+    Parameters
+    ----------
+    dname : str, optional
+        the directory which contains the datacube
+
+    Returns
+    -------
+    stamps : list of str
+        the date and time of each slice (in "YYYY-MM-DD_HH-MM" format)
+    cube : numpy.ndarray
+        the 3D (read-only) array of sea ice concentrations (in %)
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Find the shape of a slice from the reference latitudes and longitudes ...
+    ny = os.path.getsize(f"{dname}/lat.bin") // numpy.dtype(numpy.float32).itemsize
+    nx = os.path.getsize(f"{dname}/lon.bin") // numpy.dtype(numpy.float32).itemsize
+
+    # Load the time index ...
+    stamps = []
+    with open(f"{dname}/cube.csv", mode = "rt", encoding = "utf-8") as fObj:
+        for line in fObj:
+            if line.startswith("index,"):
+                continue
+            _, stamp = line.strip().split(",")
+            stamps.append(stamp)
+
+    # Check that there are at least as many slices as there are times ...
+    # NOTE: The time index is appended *after* the slice, therefore if
+    #       "createCube.py" was interrupted then there may be a partial slice
+    #       at the end of the datacube, which is ignored here.
+    assert os.path.getsize(f"{dname}/cube.bin") >= len(stamps) * ny * nx
+
+    # Check if the datacube is empty ...
+    if len(stamps) == 0:
+        # Return answer ...
+        return stamps, numpy.zeros(
+            (0, ny, nx),
+            dtype = numpy.int8,
+        )
+
+    # Return answer ...
+    return stamps, numpy.memmap(
+        f"{dname}/cube.bin",
+        dtype = numpy.int8,
+         mode = "r",
+        shape = (len(stamps), ny, nx),
+    )
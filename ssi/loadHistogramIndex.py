@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadHistogramIndex(
+    dname = "studyBalticConcentration",
+    /,
+):
+    """Load the time index of the store of histograms of Baltic sea ice
+
+    Parameters
+    ----------
+    dname : str, optional
+        the directory which contains the store of histograms
+
+    Returns
+    -------
+    index : dict
+        the row of each date and time (in "YYYY-MM-DD_HH-MM" format) in the
+        store of histograms (in the order that they were appended)
+    """
+
+    # Import standard modules ...
+    import os
+
+    # **************************************************************************
+
+    # Initialize dictionary ...
+    index = {}
+
+    # Check if the store of histograms does not exist ...
+    if not os.path.exists(f"{dname}/histograms.csv"):
+        # Return answer ...
+        return index
+
+    # Load the time index ...
+    with open(f"{dname}/histograms.csv", mode = "rt", encoding = "utf-8") as fObj:
+        for line in fObj:
+            if line.startswith("index,"):
+                continue
+            row, stamp = line.strip().split(",")
+            index[stamp] = int(row)
+
+    # Return answer ...
+    return index
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadHistograms(
+    dname = "studyBalticConcentration",
+    /,
+):
+    """Load the store of histograms of Baltic sea ice
+
+    The store of histograms is a raw binary file of float64 areas shaped (time,
+    concentration), which is accompanied by a CSV file which lists the date and
+    time of each row (in the order that they were appended). This function
+    reads the whole store in one go and returns the rows in chronological
+    order, without the rows which have been removed by :func:`saveHistogram`.
+
+    Parameters
+    ----------
+    dname : str, optional
+        the directory which contains the store of histograms
+
+    Returns
+    -------
+    stamps : list of str
+        the date and time of each histogram (in "YYYY-MM-DD_HH-MM" format)
+    hists : numpy.ndarray
+        the 2D array of the total area which has each concentration (in km2)
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .loadHistogramIndex import loadHistogramIndex
+
+    # **************************************************************************
+
+    # Load the time index ...
+    index = loadHistogramIndex(dname)
+
+    # Check if the store of histograms is empty ...
+    if len(index) == 0:
+        # Return answer ...
+        return [], numpy.zeros(
+            (0, 101),
+            dtype = numpy.float64,
+        )
+
+    # Check that there are at least as many rows as there are times ...
+    # NOTE: The time index is appended *after* the row, therefore if
+    #       :func:`saveHistogram` was interrupted then there may be a partial
+    #       row at the end of the store, which is ignored here.
+    assert os.path.getsize(f"{dname}/histograms.bin") >= len(index) * 101 * numpy.dtype(numpy.float64).itemsize
+
+    # Load the store of histograms ...
+    hists = numpy.fromfile(
+        f"{dname}/histograms.bin",
+        count = len(index) * 101,
+        dtype = numpy.float64,
+    ).reshape(len(index), 101)                                                  # [km2]
+
+    # Sort the times and skip the rows which have been removed ...
+    stamps = sorted(stamp for stamp, row in index.items() if not numpy.isnan(hists[row, 0]))
+
+    # Return answer ...
+    return stamps, hists[[index[stamp] for stamp in stamps], :]
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadManifest(
+    jName = "studyBalticConcentration/manifest.json",
+    /,
+):
+    """Load the manifest of the artefacts
+
+    The manifest is a dictionary, keyed by the name of each artefact, of the
+    version of the code (and configuration) which made the artefact and of the
+    size, modification time and SHA-256 digest of each of its inputs.
+
+    Parameters
+    ----------
+    jName : str, optional
+        the name of the JSON file
+
+    Returns
+    -------
+    manifest : dict
+        the manifest (which is empty if the JSON file does not exist)
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # **************************************************************************
+
+    # Check if the JSON file exists ...
+    if not os.path.exists(jName):
+        # Return answer ...
+        return {}
+
+    # Return answer ...
+    with open(jName, mode = "rt", encoding = "utf-8") as fObj:
+        return json.load(fObj)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadNetCDF(
+    nName,
+    /,
+):
+    """Load a NetCDF file of Baltic sea ice concentration
+
+    Parameters
+    ----------
+    nName : str
+        the name of the NetCDF file
+
+    Returns
+    -------
+    lat : numpy.ndarray
+        the 1D array of latitudes (in degrees)
+    lon : numpy.ndarray
+        the 1D array of longitudes (in degrees)
+    conc : numpy.ndarray
+        the 3D array of sea ice concentrations (in %)
+
+    Notes
+    -----
+    A ValueError is raised by :class:`scipy.io.netcdf_file` if the NetCDF file
+    cannot be loaded.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import scipy
+        import scipy.io
+    except:
+        raise Exception("\"scipy\" is not installed; run \"pip install --user scipy\"") from None
+
+    # **************************************************************************
+
+    # Open NetCDF file ...
+    with scipy.io.netcdf_file(nName, mode = "r") as fObj:
+        # Create short-hands ...
+        lat = numpy.array(fObj.variables["lat"][:]).astype(numpy.float32)       # [°]
+        lon = numpy.array(fObj.variables["lon"][:]).astype(numpy.float32)       # [°]
+        conc = numpy.array(fObj.variables["ice_concentration"][:, :, :]).astype(numpy.int8) # [%]
+
+    # Demonstrate how the data is arranged ...
+    assert len(lat.shape) == 1
+    assert len(lon.shape) == 1
+    assert len(conc.shape) == 3
+    assert conc.shape == (1, lat.size, lon.size)
+
+    # Return answer ...
+    return lat, lon, conc
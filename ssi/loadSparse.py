@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadSparse(
+    sName,
+    /,
+):
+    """Load a sparse file of Baltic sea ice concentration
+
+    Parameters
+    ----------
+    sName : str
+        the name of the sparse file
+
+    Returns
+    -------
+    sparse : numpy.ndarray
+        the 1D array of records, with fields "idx" (the flat index of the pixel)
+        and "lvl" (the sea ice concentration of the pixel, in %)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .sparseDtype import sparseDtype
+
+    # **************************************************************************
+
+    # Return answer ...
+    return numpy.fromfile(
+        sName,
+        dtype = sparseDtype(),
+    )
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadWater(
+    dname = "studyBalticConcentration",
+    /,
+):
+    """Load the index and the area of the water pixels in the reference map
+
+    This function memory-maps the raw binary files which are made by
+    "step0_checkData.py" (by :func:`calcWater`): "water.bin" is the flat
+    indices (as little-endian uint32) of the water pixels and "weights.bin" is
+    the area (as float64) of each of them. No data is copied until it is used.
+
+    Parameters
+    ----------
+    dname : str, optional
+        the directory which contains the raw binary files
+
+    Returns
+    -------
+    iWater : numpy.ndarray
+        the 1D (read-only) array of the flat indices of the water pixels
+    weights : numpy.ndarray
+        the 1D (read-only) array of the area of each water pixel (in km2)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Load BIN files ...
+    iWater = numpy.memmap(
+        f"{dname}/water.bin",
+        dtype = "<u4",
+         mode = "r",
+    )
+    weights = numpy.memmap(
+        f"{dname}/weights.bin",
+        dtype = numpy.float64,
+         mode = "r",
+    )                                                                           # [km2]
+
+    # Check that there is an area for every water pixel ...
+    assert iWater.size == weights.size
+
+    # Return answer ...
+    return iWater, weights
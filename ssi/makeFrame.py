@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeFrame(
+    mName,
+    pName,
+    fName,
+    /,
+):
+    """Make a PNG frame of Baltic sea ice concentration
+
+    This function is the task which is run (in a worker process) for each date
+    by "step4_createFrames.py". It pastes the map and the plot side-by-side
+    onto a new frame, saves it and optimises it. The frame is saved (and
+    optimised) under a temporary name and is only then moved into place, so
+    that an interrupted frame is never mistaken for a finished one.
+
+    Parameters
+    ----------
+    mName : str
+        the name of the PNG map
+    pName : str
+        the name of the PNG plot
+    fName : str
+        the name of the PNG frame
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import PIL
+        import PIL.Image
+        PIL.Image.MAX_IMAGE_PIXELS = 1024 * 1024 * 1024                         # [px]
+    except:
+        raise Exception("\"PIL\" is not installed; run \"pip install --user Pillow\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.image
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Open image as RGB (even if it is paletted) ...
+    with PIL.Image.open(mName) as iObj:
+        im1 = iObj.convert("RGB")
+
+    # Open image as RGB (even if it is paletted) ...
+    with PIL.Image.open(pName) as iObj:
+        im2 = iObj.convert("RGB")
+
+    # Calculate width (ensuring that it is even) ...
+    w = im1.width + im2.width + 30                                              # [px]
+    if w % 2 == 1:
+        w += 1                                                                  # [px]
+
+    # Calculate height (ensuring that it is even) ...
+    h = max(im1.height, im2.height) + 20                                        # [px]
+    if h % 2 == 1:
+        h += 1                                                                  # [px]
+
+    # Create empty frame ...
+    assert (w * h) <= PIL.Image.MAX_IMAGE_PIXELS, f"image size is larger than maximum number of pixels allowed in Pillow ({w:,d} px × {h:,d} px > {PIL.Image.MAX_IMAGE_PIXELS:,d} px)"
+    im0 = PIL.Image.new("RGB", (w, h), (242, 242, 242))
+
+    # Add the map and the plot ...
+    im0.paste(im1, (10, 10 + ((im0.height - 20) - im1.height) // 2))
+    im0.paste(im2, (20 + im1.width, 10 + ((im0.height - 20) - im2.height) // 2))
+
+    # Save frame under a temporary name, optimise it and move it into place ...
+    tName = f"{fName.removesuffix('.png')}.tmp.png"
+    im0.save(tName)
+    pyguymer3.image.optimise_image(
+        tName,
+        strip = True,
+    )
+    os.replace(tName, fName)
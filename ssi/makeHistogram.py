@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeHistogram(
+    nName,
+    sName,
+    /,
+):
+    """Make a histogram of Baltic sea ice concentration
+
+    This function is the task which is run (in a worker process) for each
+    NetCDF file by "step2_createHistograms.py". It loads the NetCDF file and
+    passes the sea ice concentrations to :func:`calcHistogram`, using the shape
+    of the map ("shape"), the flat indices of the water pixels ("iWater") and
+    the area of each of them ("weights") which were shared with the worker
+    process by :func:`initialiseWorker`. The histogram is returned (rather than
+    saved) so that only the main process writes to the store of histograms.
+
+    If the sparse file of the NetCDF file is up-to-date then it is loaded
+    instead (which is only a few KB) and it is passed to
+    :func:`calcSparseHistogram`, which gives the same histogram.
+
+    Parameters
+    ----------
+    nName : str
+        the name of the NetCDF file
+    sName : None, str
+        the name of the up-to-date sparse file of the NetCDF file (None if
+        there isn't one)
+
+    Returns
+    -------
+    status : str
+        the status of the NetCDF file ("corrupt", "no ice" or "ok"); the
+        histogram was only made if it is "ok"
+    hist : None, numpy.ndarray
+        the 1D array of the total area which has each concentration (in km2),
+        or None if it was skipped
+    msg : None, str
+        None if the histogram was made, otherwise the reason why it was skipped
+    """
+
+    # Import sub-functions ...
+    from .calcHistogram import calcHistogram
+    from .calcSparseHistogram import calcSparseHistogram
+    from .loadNetCDF import loadNetCDF
+    from .loadSparse import loadSparse
+    from .shared import SHARED
+
+    # **************************************************************************
+
+    # Check if there is an up-to-date sparse file ...
+    if sName is not None:
+        # Load sparse file ...
+        sparse = loadSparse(sName)
+
+        # Skip if there isn't any sea ice ...
+        # NOTE: The reference map does not have any sea ice, therefore only
+        #       the pixels in the sparse file can have any.
+        if sparse.size == 0 or sparse["lvl"].max() <= 0:
+            return "no ice", None, " > Skipping, no sea ice."
+
+        # Return answer ...
+        hist = calcSparseHistogram(sparse, SHARED["iWater"], SHARED["weights"]) # [km2]
+        return "ok", hist, None
+
+    # Skip if there are errors ...
+    try:
+        # Load NetCDF file and extract the first time from the dataset ...
+        _, _, conc = loadNetCDF(nName)                                          # [%]
+    except ValueError:
+        return "corrupt", None, " > Skipping, error loading NetCDF."
+    lvl = conc[0, :, :]                                                         # [%]
+
+    # Demonstrate how the data is arranged ...
+    assert len(lvl.shape) == 2
+    assert lvl.shape == SHARED["shape"]
+
+    # Skip if there isn't any sea ice ...
+    if lvl.max() <= 0:
+        return "no ice", None, " > Skipping, no sea ice."
+
+    # Return answer ...
+    return "ok", calcHistogram(lvl, SHARED["iWater"], SHARED["weights"]), None  # [km2]
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeLut(
+    turbo,
+    /,
+):
+    """Make the colour lookup table for the maps
+
+    This function makes the colour lookup table which is used to render the
+    maps. The first 256 entries are the colour table for water (from 0% to
+    100% sea ice concentration), the 257th entry is white (for land) and the
+    258th entry is grey (for out-of-scope water).
+
+    Parameters
+    ----------
+    turbo : numpy.ndarray
+        the 2D array of the "turbo" colour table
+
+    Returns
+    -------
+    lut : numpy.ndarray
+        the 2D array of the colour lookup table
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check argument ...
+    assert turbo.shape == (256, 3)
+
+    # Make the lookup table ...
+    lut = numpy.zeros(
+        (258, 3),
+        dtype = numpy.uint8,
+    )
+    lut[:256, :] = turbo                                                        # water
+    lut[256, :] = 255                                                           # land
+    lut[257, :] = 191                                                           # out-of-scope water
+
+    # Return answer ...
+    return lut
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeMap(
+    nName,
+    pNames,
+    /,
+):
+    """Make a PNG map of Baltic sea ice concentration
+
+    This function is the task which is run (in a worker process) for each
+    NetCDF file by "step1_createMaps.py". It loads the NetCDF file (only once)
+    and passes the sea ice concentrations to :func:`writeMap` for the map and
+    for each level of the pyramid of reduced-resolution maps which need
+    making.
+
+    Parameters
+    ----------
+    nName : str
+        the name of the NetCDF file
+    pNames : dict of str
+        the name of the PNG file of each reduction factor which needs making (1
+        for the full-resolution map)
+
+    Returns
+    -------
+    status : str
+        the status of the NetCDF file ("corrupt", "no ice" or "ok"); the PNG
+        files were only made if it is "ok"
+    msg : str
+        how the PNG files were encoded, or why they were skipped
+    """
+
+    # Import sub-functions ...
+    from .loadNetCDF import loadNetCDF
+    from .shared import SHARED
+    from .writeMap import writeMap
+
+    # **************************************************************************
+
+    # Skip if there are errors ...
+    try:
+        # Load NetCDF file and extract the first time from the dataset ...
+        _, _, conc = loadNetCDF(nName)                                          # [%]
+    except ValueError:
+        return "corrupt", " > Skipping, error loading NetCDF."
+    lvl = conc[0, :, :]                                                         # [%]
+
+    # Demonstrate how the data is arranged ...
+    assert len(lvl.shape) == 2
+    assert lvl.shape == SHARED["base"].shape[:2]
+
+    # Skip if there isn't any sea ice ...
+    if lvl.max() <= 0:
+        return "no ice", " > Skipping, no sea ice."
+
+    # Initialize list ...
+    msgs = []
+
+    # Loop over reduction factors ...
+    for factor, pName in pNames.items():
+        # Make map ...
+        msgs.append(writeMap(lvl, nName, pName, factor = factor))
+
+    # Return answer ...
+    return "ok", "\n".join(msgs)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeOverlay(
+    lines,
+    charsArr,
+    sp,
+    /,
+):
+    """Make a reusable overlay of the lines of text which are on every map
+
+    This function renders the lines of text which are the same on every map
+    (e.g., the title and the credits) once, using :func:`renderText`, so that
+    :func:`writeMap` only has to copy them onto each map and render the line of
+    text which changes from map to map (i.e., the date and time). Each line is
+    one glyph tall and only the pixels which are covered by a glyph are part of
+    the overlay (i.e., a short line does not hide the map to the right of it).
+
+    Parameters
+    ----------
+    lines : list of str
+        the lines of text
+    charsArr : numpy.ndarray
+        the 3D array of the RGB image of the alphabet
+    sp : int
+        the width of each glyph in the alphabet (in px)
+
+    Returns
+    -------
+    overlay : dict
+        the 3D array of the RGB image of the lines of text ("tile") and the 2D
+        array of which of its pixels are covered by a glyph ("mask")
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .renderText import renderText
+
+    # **************************************************************************
+
+    # Create short-hands ...
+    ny = len(lines) * charsArr.shape[0]                                         # [px]
+    nx = max(len(line) for line in lines) * sp                                  # [px]
+
+    # Make empty overlay ...
+    tile = numpy.zeros((ny, nx, charsArr.shape[2]), dtype = charsArr.dtype)
+    mask = numpy.zeros((ny, nx), dtype = bool)
+
+    # Loop over lines ...
+    for i, line in enumerate(lines):
+        # Render the line and add it to the overlay ...
+        img = renderText(line, charsArr, sp)
+        iy = i * charsArr.shape[0]                                              # [px]
+        tile[iy:iy + img.shape[0], :img.shape[1], :] = img
+        mask[iy:iy + img.shape[0], :img.shape[1]] = True
+
+    # Return answer ...
+    return {
+        "mask" : mask,
+        "tile" : tile,
+    }
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makePlotTemplate(
+    dates,
+    equivs,
+    labelsLoc,
+    labelsTxt,
+    /,
+):
+    """Make a reusable template of the plot of Baltic sea ice for each day
+
+    This function makes the figure which is used by "step3_createPlots.py" for
+    every day, plots the history of the 100%-concentration equivalent sea ice
+    area (thousands of bars), shades every alternate year, configures the axes
+    and lays out the figure, all only once. It then renders everything which
+    does not change from day to day and caches it as the background.
+
+    The artists which change from day to day (the highlight bar of the day and
+    the bars of the histogram) and the artists which must be drawn on top of
+    them (the shading, the axes and the spines) are marked as animated, so that
+    they are not part of the background. :func:`drawPlot` draws them on top of
+    the cached background, in the same order as a full render would, so the
+    plot is the same as one made from scratch.
+
+    Parameters
+    ----------
+    dates : list of str
+        the dates (in "YYYY-MM-DD" format)
+    equivs : list of float
+        the 100%-concentration equivalent sea ice area on each date (in 10^3
+        km2)
+    labelsLoc : list of str
+        the dates of the tick labels (in "YYYY-MM-DD" format)
+    labelsTxt : list of str
+        the tick labels
+
+    Returns
+    -------
+    template : dict
+        the figure ("fg"), the cached background ("bg"), the highlight bar
+        ("highlight"), the bars of the histogram ("bars"), the artists to draw
+        on top of the background for each axis ("layers") and the index of
+        each date on the categorical axis ("index")
+    """
+
+    # Import special modules ...
+    try:
+        import matplotlib
+        import matplotlib.pyplot
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Create short-hand for the concentrations ...
+    x = numpy.arange(101, dtype = numpy.float64)                                # [%]
+
+    # Create figure ...
+    fg = matplotlib.pyplot.figure(figsize = (4.1, 4.9))
+
+    # Create axes ...
+    ax = fg.subplots(2, 1)
+
+    # Plot data ...
+    # NOTE: The highlight bar and the bars of the histogram are placeholders
+    #       which are moved and resized for each day by drawPlot().
+    ax[0].bar(
+        dates,
+        equivs,
+        width = 1,
+    )
+    highlight = ax[0].bar(
+        [dates[0]],
+        [0.0],
+        width = 10,
+    ).patches[0]
+    bars = ax[1].bar(
+        x,
+        numpy.zeros_like(x),
+        width = 1,
+    ).patches
+
+    # Configure axis ...
+    ax[0].grid()
+    ax[0].set_xlim(dates[0], dates[-1])
+    ax[0].set_xticks(
+        labelsLoc,
+          labels = labelsTxt,
+              ha = "right",
+        rotation = 45,
+    )
+    ax[0].set_ylabel("100%-Concentration Equivalent\nSea Ice Area [10³ km²]")
+    ax[0].set_ylim(0.0, 170.0)
+
+    # Configure axis ...
+    ax[1].grid()
+    ax[1].set_xlabel("Concentration [%]")
+    ax[1].set_xlim(-0.5, 100.5)
+    ax[1].set_ylabel("Sea Ice Area [10³ km²]")
+    ax[1].set_ylim(0, 85)
+
+    # Shade alternate years ...
+    spans = []
+    for yyyy in range(int(dates[0].split("-")[0]), int(dates[-1].split("-")[0]) + 1, 2):
+        spans.append(
+            ax[0].axvspan(
+                f"{yyyy}-01-01",
+                f"{yyyy}-12-31",
+                    alpha = 0.25,
+                facecolor = "grey",
+            )
+        )
+
+    # Configure figure ...
+    fg.tight_layout()
+
+    # Find the artists which must be drawn on top of the background for each
+    # axis, in the same order as Axes.draw() would draw them (i.e., the
+    # patches in the order that they were added, then the axes, then the
+    # spines) ...
+    layers = [
+        [highlight] + spans + [ax[0].xaxis, ax[0].yaxis] + list(ax[0].spines.values()),
+        list(bars) + [ax[1].xaxis, ax[1].yaxis] + list(ax[1].spines.values()),
+    ]
+
+    # Exclude them from the background, render the background and cache it ...
+    for layer in layers:
+        for artist in layer:
+            artist.set_animated(True)
+    fg.canvas.draw()
+    bg = fg.canvas.copy_from_bbox(fg.bbox)
+
+    # Return answer ...
+    return {
+             "bars" : bars,
+               "bg" : bg,
+               "fg" : fg,
+        "highlight" : highlight,
+            "index" : {date : i for i, date in enumerate(dates)},
+           "layers" : layers,
+    }
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makePlots(
+    block,
+    /,
+):
+    """Make a block of PNG plots of Baltic sea ice
+
+    This function is the task which is run (in a worker process) for each
+    contiguous block of dates by "step3_createPlots.py". The first time that it
+    is run in a worker process it configures matplotlib (using the "rcParams"
+    shared by :func:`initialiseWorker`) and makes the template (using the
+    "dates", "equivs", "labelsLoc" and "labelsTxt" shared by
+    :func:`initialiseWorker`), which it then keeps for every later block. It
+    then draws and optimises each plot in the block in turn.
+
+    Parameters
+    ----------
+    block : list of tuple
+        the date (in "YYYY-MM-DD" format), the 100%-concentration equivalent
+        sea ice area on the date (in 10^3 km2), the 1D array of the total area
+        which has each concentration (in 10^3 km2) and the name of the PNG file
+        of each plot
+    """
+
+    # Import special modules ...
+    try:
+        import matplotlib
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.image
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from .drawPlot import drawPlot
+    from .makePlotTemplate import makePlotTemplate
+    from .shared import SHARED
+
+    # **************************************************************************
+
+    # Check if this is the first block in this worker process ...
+    if "template" not in SHARED:
+        # Configure matplotlib in the same way as the main process ...
+        # NOTE: The worker process is not necessarily a fork of the main
+        #       process, therefore it must be configured before "pyplot" is
+        #       imported by makePlotTemplate().
+        matplotlib.rcParams.update(SHARED["rcParams"])
+
+        # Make the template ...
+        SHARED["template"] = makePlotTemplate(
+            SHARED["dates"],
+            SHARED["equivs"],
+            SHARED["labelsLoc"],
+            SHARED["labelsTxt"],
+        )
+
+    # Loop over plots ...
+    for date, equiv, hist, pName in block:
+        # Draw the plot ...
+        drawPlot(SHARED["template"], date, equiv, hist, pName)
+
+        # Optimize PNG ...
+        pyguymer3.image.optimise_image(
+            pName,
+            strip = True,
+        )
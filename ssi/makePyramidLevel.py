@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makePyramidLevel(
+    refLvl,
+    lut,
+    factor,
+    /,
+):
+    """Make a level of the pyramid of reduced-resolution maps
+
+    This function reduces the reference map by a factor, by splitting it into
+    square blocks of pixels and classifying each block as the class which most
+    of its pixels have (water wins any ties, then land). The blocks along the
+    bottom and right edges may be smaller than the rest. It then finds which
+    water pixels are averaged into each water block by :func:`reduceMap` (the
+    water pixels which are in a land block or an out-of-scope block are
+    ignored, so that the coastline does not bleed) and renders the background
+    of the level with :func:`renderBase`, all only once.
+
+    Parameters
+    ----------
+    refLvl : numpy.ndarray
+        the 2D array of the reference map (0 for water, -99 for land and -59 for
+        out-of-scope water)
+    lut : numpy.ndarray
+        the 2D array of the colour lookup table
+    factor : int
+        the reduction factor (e.g., 2 for half the width and half the height)
+
+    Returns
+    -------
+    level : dict
+        the 3D array of the RGB image of the background of the level ("base"),
+        the 1D array of the number of water pixels in each water block
+        ("counts"), the 1D array of the index of the water block of each water
+        pixel which is averaged ("iDst"), the 1D array of the flat indices of
+        the water pixels which are averaged ("iSrc"), the 1D array of the flat
+        indices of the water blocks ("iWater") and the shape of the level
+        ("shape")
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .classifyPixels import classifyPixels
+    from .renderBase import renderBase
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert factor >= 2
+
+    # Classify the pixels of the reference map and find the shape of the
+    # level ...
+    cls = classifyPixels(refLvl)
+    ny, nx = cls.shape
+    my = -(-ny // factor)                                                       # [px]
+    mx = -(-nx // factor)                                                       # [px]
+
+    # Pad the classes so that they are a whole number of blocks (marking the
+    # padding with class 3, which is not counted) and count how many pixels
+    # of each class are in each block ...
+    pad = numpy.full(
+        (my * factor, mx * factor),
+        3,
+        dtype = numpy.uint8,
+    )
+    pad[:ny, :nx] = cls
+    pad = pad.reshape(my, factor, mx, factor)
+    n = numpy.stack([(pad == i).sum(axis = (1, 3)) for i in range(3)])
+
+    # Classify the blocks and make the reference map of the level ...
+    # NOTE: "numpy.argmax()" returns the first of any tied classes.
+    clsLvl = n.argmax(axis = 0).astype(numpy.uint8)
+    refLvlLvl = numpy.array([0, -99, -59], dtype = numpy.int8)[clsLvl]
+
+    # Find the flat indices of the water blocks and the index of each of them
+    # in that list ...
+    iWater = numpy.flatnonzero(clsLvl == 0).astype(numpy.uint32)
+    pos = numpy.full(my * mx, -1, dtype = numpy.int64)
+    pos[iWater] = numpy.arange(iWater.size, dtype = numpy.int64)
+
+    # Find the water pixels and the block that each of them is in, and only
+    # keep the ones which are in a water block ...
+    iSrc = numpy.flatnonzero(cls == 0)
+    iBlock = (iSrc // nx // factor) * mx + (iSrc % nx) // factor
+    keep = clsLvl.reshape(-1)[iBlock] == 0
+    iSrc = iSrc[keep].astype(numpy.uint32)
+    iDst = pos[iBlock[keep]]
+
+    # Return answer ...
+    return {
+          "base" : renderBase(refLvlLvl, lut),
+        "counts" : numpy.bincount(iDst, minlength = iWater.size).astype(numpy.float64),
+          "iDst" : iDst,
+          "iSrc" : iSrc,
+        "iWater" : iWater,
+         "shape" : (my, mx),
+    }
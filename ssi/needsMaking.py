@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def needsMaking(
+    manifest,
+    oName,
+    iNames,
+    version,
+    /,
+    *,
+        adopt = True,
+    catalogue = None,
+       exists = None,
+):
+    """Check if an artefact needs making (again)
+
+    An artefact needs making if it does not exist, if it was made by a
+    different version of the code (or configuration), if its inputs are
+    different or if the content of any of its inputs has changed. The content
+    of an input is only hashed if its size or modification time has changed
+    (for example, if "lftp mirror" has downloaded it again). The size and
+    modification time of an input which is a NetCDF file in the catalogue are
+    taken from the catalogue (which has just been refreshed) rather than by
+    stat-ing the NetCDF file again.
+
+    If the artefact exists but it is not in the manifest (because it was made
+    before the manifest existed) then, if adopt is True, it is assumed to be
+    up-to-date and it is recorded in the manifest.
+
+    Parameters
+    ----------
+    manifest : dict
+        the manifest
+    oName : str
+        the name of the artefact
+    iNames : list of str
+        the names of the inputs of the artefact
+    version : str
+        the version of the code (and configuration) which makes the artefact
+    adopt : bool, optional
+        adopt an existing artefact which is not in the manifest
+    catalogue : None, dict, optional
+        the catalogue (as returned by :func:`loadCatalogue`), or None to stat
+        every input
+    exists : None, bool, optional
+        whether the artefact exists (None to check if there is a file called
+        oName, which is not the case for artefacts which are stored inside
+        another file, such as the rows of the store of histograms)
+
+    Returns
+    -------
+    ans : bool
+        whether the artefact needs making
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import sub-functions ...
+    from .hashFile import hashFile
+    from .recordArtefact import recordArtefact
+
+    # **************************************************************************
+
+    # Check if the artefact does not exist ...
+    if exists is None:
+        exists = os.path.exists(oName)
+    if not exists:
+        # Return answer ...
+        return True
+
+    # Check if the artefact is not in the manifest ...
+    if oName not in manifest:
+        # Check if the artefact should not be adopted ...
+        if not adopt:
+            # Return answer ...
+            return True
+
+        # Adopt the artefact ...
+        recordArtefact(manifest, oName, iNames, version)
+
+        # Return answer ...
+        return False
+
+    # Create short-hand ...
+    record = manifest[oName]
+
+    # Check if the version or the inputs are different ...
+    if record["version"] != version or sorted(record["inputs"].keys()) != sorted(iNames):
+        # Return answer ...
+        return True
+
+    # Loop over inputs ...
+    for iName in iNames:
+        # Skip this input if its size and modification time in the catalogue
+        # are unchanged ...
+        if catalogue is not None and iName in catalogue["files"]:
+            if catalogue["files"][iName]["size"] == record["inputs"][iName]["size"] and catalogue["files"][iName]["mtime"] == record["inputs"][iName]["mtime"]:
+                continue
+
+        # Check if the input does not exist ...
+        if not os.path.exists(iName):
+            # Return answer ...
+            return True
+
+        # Create short-hand ...
+        stat = os.stat(iName)
+
+        # Skip this input if its size and modification time are unchanged ...
+        if stat.st_size == record["inputs"][iName]["size"] and stat.st_mtime_ns == record["inputs"][iName]["mtime"]:
+            continue
+
+        # Check if the content of the input has changed ...
+        if hashFile(iName, stat.st_size, stat.st_mtime_ns) != record["inputs"][iName]["sha256"]:
+            # Return answer ...
+            return True
+
+        # Update the size and modification time of the input (so that it is
+        # not hashed again next time) ...
+        record["inputs"][iName]["size"] = stat.st_size                          # [B]
+        record["inputs"][iName]["mtime"] = stat.st_mtime_ns                     # [ns]
+
+    # Return answer ...
+    return False
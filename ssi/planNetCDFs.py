@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def planNetCDFs(
+    nNames,
+    /,
+    *,
+    latest = False,
+):
+    """Plan which NetCDF files of Baltic sea ice concentration to process
+
+    The later steps only use the most up-to-date product for each day,
+    therefore when latest is True only the last NetCDF file for each day is
+    planned (and the NetCDF files which it supersedes are not decoded at all).
+
+    Parameters
+    ----------
+    nNames : iterable of str
+        the names of the NetCDF files
+    latest : bool, optional
+        only plan the last NetCDF file for each day
+
+    Returns
+    -------
+    plan : list of tuple
+        the (date and time (in "YYYY-MM-DD_HH-MM" format), name) tuples of the
+        NetCDF files to process (in chronological order)
+    """
+
+    # Import sub-functions ...
+    from .indexNetCDFs import indexNetCDFs
+
+    # **************************************************************************
+
+    # Index the NetCDF files by day ...
+    index = indexNetCDFs(nNames)
+
+    # Check if only the last NetCDF file for each day is wanted ...
+    if latest:
+        # Return answer ...
+        return [nFiles[-1] for nFiles in index.values()]
+
+    # Return answer ...
+    return [nFile for nFiles in index.values() for nFile in nFiles]
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def pngProfile(
+    profile,
+    /,
+):
+    """Return the keyword arguments of an encoding profile for makePng()
+
+    The "archival" profile tries every PNG filter with every combination of
+    settings at zlib level 9 and keeps the smallest result (which is slow). The
+    "fast" profile only uses the "Up" filter with one combination of settings at
+    zlib level 1 (which is fast, but which makes larger files).
+
+    Parameters
+    ----------
+    profile : str
+        the name of the profile ("archival" or "fast")
+
+    Returns
+    -------
+    kwargs : dict
+        the keyword arguments to pass to :func:`pyguymer3.image.makePng`
+    """
+
+    # Import standard modules ...
+    import zlib
+
+    # **************************************************************************
+
+    # Check which profile it is ...
+    match profile:
+        case "archival":
+            # Return answer ...
+            return {
+                "calcAdaptive" : True,
+                 "calcAverage" : True,
+                    "calcNone" : True,
+                   "calcPaeth" : True,
+                     "calcSub" : True,
+                      "calcUp" : True,
+                     "choices" : "all",
+                      "levels" : [9,],
+                   "memLevels" : [9,],
+                  "strategies" : None,
+                      "wbitss" : [15,],
+            }
+        case "fast":
+            # Return answer ...
+            return {
+                "calcAdaptive" : False,
+                 "calcAverage" : False,
+                    "calcNone" : False,
+                   "calcPaeth" : False,
+                     "calcSub" : False,
+                      "calcUp" : True,
+                     "choices" : "all",
+                      "levels" : [1,],
+                   "memLevels" : [9,],
+                  "strategies" : [zlib.Z_DEFAULT_STRATEGY,],
+                      "wbitss" : [15,],
+            }
+        case _:
+            # Crash ...
+            raise ValueError(f"\"{profile}\" is not a recognised profile") from None
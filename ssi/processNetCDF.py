@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def processNetCDF(
+    nName,
+    pName,
+    hName,
+    sName,
+    /,
+    *,
+    sparse = None,
+):
+    """Check, map and histogram a NetCDF file of Baltic sea ice concentration
+
+    This function is the task which is run (in a worker process) for each
+    NetCDF file by "step012_processData.py". It loads the NetCDF file once and
+    then passes the sea ice concentrations to each stage of the pipeline in
+    turn: the checker (which compares the file against the reference latitudes
+    ("refLat"), longitudes ("refLon") and map ("refLvl")); :func:`writeMap`;
+    and :func:`calcHistogram` (using the flat indices of the water pixels
+    ("iWater") and the area of each of them ("weights")). The histogram is
+    returned (rather than saved) so that only the main process writes to the
+    store of histograms.
+
+    If the histogram is the only artefact which needs making and the sparse
+    file is up-to-date then the NetCDF file is not loaded at all; instead, the
+    histogram is made from the sparse file by :func:`makeHistogram`.
+
+    Parameters
+    ----------
+    nName : str
+        the name of the NetCDF file
+    pName : None, str
+        the name of the PNG file (None if it does not need making)
+    hName : None, str
+        the name of the histogram in the manifest (None if it does not need
+        making)
+    sName : None, str
+        the name of the sparse file (None if it does not need making)
+    sparse : None, str, optional
+        the name of the up-to-date sparse file to make the histogram from
+        (None to load the NetCDF file)
+
+    Returns
+    -------
+    status : str
+        the status of the NetCDF file ("corrupt", "no ice" or "ok")
+    msgs : list of str
+        the messages to print
+    made : list of str
+        the names of the artefacts which were made
+    hist : None, numpy.ndarray
+        the 1D array of the total area which has each concentration (in km2),
+        or None if it was not made
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calcHistogram import calcHistogram
+    from .loadNetCDF import loadNetCDF
+    from .makeHistogram import makeHistogram
+    from .shared import SHARED
+    from .writeMap import writeMap
+    from .writeSparse import writeSparse
+
+    # **************************************************************************
+
+    # Check if the histogram can be made from the sparse file ...
+    if sparse is not None:
+        # Check arguments ...
+        assert pName is None
+        assert hName is not None
+        assert sName is None
+
+        # Make histogram and check if it was skipped ...
+        status, hist, msg = makeHistogram(nName, sparse)                        # [km2]
+        if status != "ok":
+            return status, [msg], [], None
+
+        # Return answer ...
+        return "ok", [f" > Making \"{hName}\" from \"{sparse}\" ..."], [hName], hist
+
+    # Skip if there are errors ...
+    try:
+        # Load NetCDF file ...
+        lat, lon, conc = loadNetCDF(nName)                                      # [°], [°], [%]
+    except ValueError:
+        return "corrupt", [" > Skipping, error loading NetCDF."], [], None
+
+    # Check values ...
+    assert numpy.all(numpy.isclose(lat, SHARED["refLat"]))
+    assert numpy.all(numpy.isclose(lon, SHARED["refLon"]))
+    del lat, lon
+
+    # Extract the first time from the dataset ...
+    lvl = conc[0, :, :]                                                         # [%]
+
+    # Initialize lists ...
+    msgs = []
+    made = []
+
+    # Make sparse file (if it needs making) ...
+    # NOTE: This is made even if there isn't any sea ice, so that the days
+    #       without any sea ice are distinguishable from the days without any
+    #       data.
+    if sName is not None:
+        msgs.append(f" > Making \"{sName}\" ...")
+        writeSparse(lvl, sName)
+        made.append(sName)
+
+    # Check if there isn't any sea ice in this NetCDF file ...
+    if lvl.max() <= 0:
+        # Check the map ...
+        if not numpy.all(lvl == SHARED["refLvl"]):
+            msgs.append(f"WARNING: \"{nName}\" does't have any concentration and it disagrees with the standard map.")
+        msgs.append(" > Skipping, no sea ice.")
+
+        # Return answer ...
+        return "no ice", msgs, made, None
+
+    # Make map (if it needs making) ...
+    if pName is not None:
+        msgs.append(f" > Making \"{pName}\" ...")
+        msgs.append(writeMap(lvl, nName, pName))
+        made.append(pName)
+
+    # Make histogram (if it needs making) ...
+    hist = None
+    if hName is not None:
+        msgs.append(f" > Making \"{hName}\" ...")
+        hist = calcHistogram(lvl, SHARED["iWater"], SHARED["weights"])          # [km2]
+        made.append(hName)
+
+    # Return answer ...
+    return "ok", msgs, made, hist
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def recordArtefact(
+    manifest,
+    oName,
+    iNames,
+    version,
+    /,
+):
+    """Record an artefact in the manifest
+
+    Parameters
+    ----------
+    manifest : dict
+        the manifest
+    oName : str
+        the name of the artefact
+    iNames : list of str
+        the names of the inputs of the artefact
+    version : str
+        the version of the code (and configuration) which made the artefact
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import sub-functions ...
+    from .hashFile import hashFile
+
+    # **************************************************************************
+
+    # Initialize dictionary ...
+    inputs = {}
+
+    # Loop over inputs ...
+    for iName in iNames:
+        # Record the size, modification time and digest of the input ...
+        stat = os.stat(iName)
+        inputs[iName] = {
+              "size" : stat.st_size,                                            # [B]
+             "mtime" : stat.st_mtime_ns,                                        # [ns]
+            "sha256" : hashFile(iName, stat.st_size, stat.st_mtime_ns),
+        }
+
+    # Record the artefact ...
+    manifest[oName] = {
+         "inputs" : inputs,
+        "version" : version,
+    }
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def recordStatus(
+    catalogue,
+    nName,
+    status,
+    /,
+):
+    """Record the status of a NetCDF file in the catalogue
+
+    Parameters
+    ----------
+    catalogue : dict
+        the catalogue (as returned by :func:`loadCatalogue`), which is updated
+    nName : str
+        the name of the NetCDF file
+    status : str
+        "corrupt", "no ice" or "ok"
+    """
+
+    # Import standard modules ...
+    import os
+
+    # **************************************************************************
+
+    # Check status ...
+    if status not in ["corrupt", "no ice", "ok"]:
+        raise ValueError(f"\"{status}\" is not a recognised status") from None
+
+    # Record the status along with the size and modification time of the
+    # NetCDF file (which it is only valid for) ...
+    stat = os.stat(nName)
+    catalogue["files"][nName]["mtime"] = stat.st_mtime_ns                       # [ns]
+    catalogue["files"][nName]["size"] = stat.st_size                            # [B]
+    catalogue["files"][nName]["status"] = status
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def reduceMap(
+    lvl,
+    level,
+    /,
+):
+    """Reduce a map of sea ice concentration to a level of the pyramid
+
+    This function sets the sea ice concentration of each water block of a level
+    made by :func:`makePyramidLevel` to the mean (rounded to the nearest
+    integer) of the sea ice concentrations of the water pixels in it, with a
+    single weighted :func:`numpy.bincount`. The sea ice concentrations are
+    clipped to between 0% and 100% first, as they are when the maps are
+    rendered. The land and the out-of-scope water are left as 0%, as they are
+    part of the background of the level.
+
+    Parameters
+    ----------
+    lvl : numpy.ndarray
+        the 2D array of sea ice concentrations (in %)
+    level : dict
+        the level made by :func:`makePyramidLevel`
+
+    Returns
+    -------
+    lvlLvl : numpy.ndarray
+        the 2D array of sea ice concentrations of the level (in %)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert lvl.dtype == numpy.int8
+
+    # Sum the sea ice concentrations of the water pixels in each water block ...
+    sums = numpy.bincount(
+        level["iDst"],
+        minlength = level["counts"].size,
+          weights = numpy.clip(lvl.reshape(-1)[level["iSrc"]], 0, 100).astype(numpy.float64),
+    )                                                                           # [%]
+
+    # Make the level ...
+    lvlLvl = numpy.zeros(level["shape"], dtype = numpy.int8)                    # [%]
+    lvlLvl.reshape(-1)[level["iWater"]] = numpy.rint(sums / level["counts"]).astype(numpy.int8)
+
+    # Return answer ...
+    return lvlLvl
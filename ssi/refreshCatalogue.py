@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def refreshCatalogue(
+    catalogue,
+    /,
+    *,
+    dname = "Copernicus/SEAICE_BAL_SEAICE_L4_NRT_OBSERVATIONS_011_004/FMI-BAL-SEAICE_CONC-L4-NRT-OBS",
+     full = False,
+):
+    """Refresh the catalogue of the mirror of NetCDF files
+
+    Only the year directories are listed and only the month directories are
+    stat-ed; a month directory is only listed (and its NetCDF files are only
+    stat-ed) if its modification time has changed, which it does whenever a
+    NetCDF file is added to it, removed from it or renamed within it. If the
+    size or modification time of a NetCDF file has changed then its status is
+    forgotten.
+
+    Parameters
+    ----------
+    catalogue : dict
+        the catalogue (as returned by :func:`loadCatalogue`), which is updated
+    dname : str, optional
+        the directory which contains the year directories of the mirror
+    full : bool, optional
+        list every month directory, even if its modification time is unchanged
+        (which is needed if NetCDF files are overwritten in place)
+
+    Returns
+    -------
+    nDirs : int
+        the number of month directories which were listed
+    """
+
+    # Import standard modules ...
+    import os
+    import re
+
+    # **************************************************************************
+
+    # Initialize sets ...
+    mDirs = set()
+    listed = set()
+    nNames = set()
+
+    # Loop over year directories ...
+    for yEntry in sorted(os.scandir(dname) if os.path.exists(dname) else [], key = lambda entry: entry.name):
+        # Skip anything which is not a year directory ...
+        if not yEntry.is_dir() or re.fullmatch(r"\d{4}", yEntry.name) is None:
+            continue
+
+        # Loop over month directories ...
+        for mEntry in sorted(os.scandir(yEntry.path), key = lambda entry: entry.name):
+            # Skip anything which is not a month directory ...
+            if not mEntry.is_dir() or re.fullmatch(r"\d{2}", mEntry.name) is None:
+                continue
+            mDirs.add(mEntry.path)
+
+            # Skip this month directory if it is unchanged ...
+            mtime = mEntry.stat().st_mtime_ns                                   # [ns]
+            if not full and catalogue["dirs"].get(mEntry.path) == mtime:
+                continue
+            listed.add(mEntry.path)
+
+            # Loop over NetCDF files ...
+            for nEntry in os.scandir(mEntry.path):
+                # Parse the date and time out of the name and skip anything
+                # which is not a NetCDF file ...
+                match = re.fullmatch(r"ice_conc_baltic_(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})\.nc", nEntry.name)
+                if match is None or not nEntry.is_file():
+                    continue
+                yyyy, mm, dd, hh, mi = match.groups()
+                nNames.add(nEntry.path)
+
+                # Create short-hands ...
+                stat = nEntry.stat()
+                record = catalogue["files"].get(nEntry.path)
+
+                # Skip this NetCDF file if its size and modification time are
+                # unchanged ...
+                if record is not None and record["size"] == stat.st_size and record["mtime"] == stat.st_mtime_ns:
+                    continue
+
+                # Record the NetCDF file (forgetting its status) ...
+                catalogue["files"][nEntry.path] = {
+                     "mtime" : stat.st_mtime_ns,                                # [ns]
+                      "size" : stat.st_size,                                    # [B]
+                     "stamp" : f"{yyyy}-{mm}-{dd}_{hh}-{mi}",
+                    "status" : None,
+                }
+
+            # Record the month directory ...
+            catalogue["dirs"][mEntry.path] = mtime                              # [ns]
+
+    # Forget the month directories which have been removed ...
+    for mDir in [mDir for mDir in catalogue["dirs"] if mDir not in mDirs]:
+        del catalogue["dirs"][mDir]
+
+    # Forget the NetCDF files which have been removed (either along with their
+    # month directory or from a month directory which was listed) ...
+    for nName in [nName for nName in catalogue["files"] if os.path.dirname(nName) not in mDirs or (os.path.dirname(nName) in listed and nName not in nNames)]:
+        del catalogue["files"][nName]
+
+    # Return answer ...
+    return len(listed)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def regridAreas(
+    areas,
+    /,
+    *,
+    perCell = False,
+):
+    """Regrid the area of the pixels between grid points onto the grid points
+
+    The sea ice concentrations are point-wise (i.e., they are at the grid
+    points) but :func:`calcAreas` (and :func:`calcPixelArea`) calculate the
+    area of the pixels between adjacent grid points. This function finds the
+    area of the pixel centred on each grid point as the mean area of the pixels
+    which have that grid point as a corner (the edges of the grid are extended
+    outwards by one pixel, so that every grid point has four of them).
+
+    Parameters
+    ----------
+    areas : numpy.ndarray
+        the 2D array of the area of each pixel between adjacent grid points (in
+        km2)
+    perCell : bool, optional
+        return the area of every grid point, rather than the (mean) area of the
+        grid points in each row (all of the grid points in a row have the same
+        area on a regular latitude/longitude grid)
+
+    Returns
+    -------
+    pixelAreas : numpy.ndarray
+        the 1D array of the area of a grid point in each row (in km2), or the 2D
+        array of the area of every grid point (in km2) if perCell is True
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert len(areas.shape) == 2
+
+    # Check if the user wants the area of every grid point ...
+    if perCell:
+        # Extend the edges and average each 2x2 block of pixels ...
+        tmpArr = numpy.pad(areas.astype(numpy.float64), 1, mode = "edge")       # [km2]
+
+        # Return answer ...
+        return 0.25 * (
+            tmpArr[:-1, :-1] + tmpArr[1:, :-1] + tmpArr[:-1, 1:] + tmpArr[1:, 1:]
+        )                                                                       # [km2]
+
+    # Extend the edges and average each pair of rows of pixels ...
+    tmpArr = numpy.pad(areas.astype(numpy.float64).mean(axis = 1), 1, mode = "edge")    # [km2]
+
+    # Return answer ...
+    return 0.5 * (tmpArr[:-1] + tmpArr[1:])                                     # [km2]
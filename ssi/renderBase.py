@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def renderBase(
+    refLvl,
+    lut,
+    /,
+):
+    """Render the background of a map of sea ice concentration as an RGB image
+
+    This function renders the land (entry 256 of the colour lookup table made
+    by :func:`makeLut`) and the out-of-scope water (entry 257) of the reference
+    map once, so that :func:`renderMap` only has to render the water pixels of
+    each map on top of a copy of it. The water pixels are rendered as 0%.
+
+    Parameters
+    ----------
+    refLvl : numpy.ndarray
+        the 2D array of the reference map (0 for water, -99 for land and -59 for
+        out-of-scope water)
+    lut : numpy.ndarray
+        the 2D array of the colour lookup table
+
+    Returns
+    -------
+    base : numpy.ndarray
+        the 3D array of the RGB image
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .classifyPixels import classifyPixels
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert lut.shape == (258, 3)
+
+    # Classify the pixels of the reference map ...
+    cls = classifyPixels(refLvl)
+
+    # Make the index of each pixel in the colour lookup table ...
+    # NOTE: Land (class 1) and out-of-scope water (class 2) are entries 256 and
+    #       257 of the colour lookup table.
+    idx = numpy.where(
+        cls == 0,
+        numpy.uint16(0),
+        cls.astype(numpy.uint16) + numpy.uint16(255),
+    )
+
+    # Return answer ...
+    return lut[idx]
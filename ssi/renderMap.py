@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def renderMap(
+    lvl,
+    iWater,
+    base,
+    lut,
+    /,
+):
+    """Render a map of sea ice concentration as an RGB image
+
+    This function converts the sea ice concentrations of the water pixels to
+    indices in the colour lookup table made by :func:`makeLut` (mapping 0% to
+    100% onto 0 to 255) and then renders them, with a single gather, on top of
+    a copy of the background made by :func:`renderBase`. The land and the
+    out-of-scope water are not touched.
+
+    Parameters
+    ----------
+    lvl : numpy.ndarray
+        the 2D array of sea ice concentrations (in %)
+    iWater : numpy.ndarray
+        the 1D array of the flat indices of the water pixels
+    base : numpy.ndarray
+        the 3D array of the RGB image of the background
+    lut : numpy.ndarray
+        the 2D array of the colour lookup table
+
+    Returns
+    -------
+    img : numpy.ndarray
+        the 3D array of the RGB image
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert lvl.dtype == numpy.int8
+    assert lvl.shape == base.shape[:2]
+    assert lut.shape == (258, 3)
+
+    # Scale every possible concentration from 0 to 255, mapping it from 0 % to
+    # 100 % ...
+    # NOTE: The scaling is done in single precision (and then truncated) so
+    #       that the colours are identical to the ones that the maps have
+    #       always been made with.
+    scale = 255.0 * (numpy.arange(256, dtype = numpy.uint8).view(numpy.int8).astype(numpy.float32) / 100.0)
+    numpy.place(scale, scale <   0.0,   0.0)
+    numpy.place(scale, scale > 255.0, 255.0)
+    scale = scale.astype(numpy.uint16)
+
+    # Render the water pixels on top of a copy of the background ...
+    img = base.copy()
+    img.reshape(-1, 3)[iWater, :] = lut[scale[lvl.ravel()[iWater].view(numpy.uint8)]]
+
+    # Return answer ...
+    return img
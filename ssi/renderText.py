@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def renderText(
+    text,
+    charsArr,
+    sp,
+    /,
+):
+    """Render a line of text as an RGB image using the alphabet
+
+    This function finds the location of every character of the line in the
+    alphabet made by "makeAlphabet.py" (which has a glyph for each character in
+    :data:`string.printable`, in the same order) and gathers all of the glyphs
+    side-by-side in one go, rather than one character at a time.
+
+    Parameters
+    ----------
+    text : str
+        the line of text
+    charsArr : numpy.ndarray
+        the 3D array of the RGB image of the alphabet
+    sp : int
+        the width of each glyph in the alphabet (in px)
+
+    Returns
+    -------
+    img : numpy.ndarray
+        the 3D array of the RGB image of the line of text
+    """
+
+    # Import standard modules ...
+    import string
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check arguments ...
+    assert charsArr.shape[1] == len(string.printable) * sp
+
+    # Make the location of each ASCII character in the alphabet (-1 if it is
+    # not in the alphabet) ...
+    table = numpy.full(256, -1, dtype = numpy.int16)
+    table[numpy.frombuffer(string.printable.encode("ascii"), dtype = numpy.uint8)] = numpy.arange(len(string.printable), dtype = numpy.int16)
+
+    # Find the location of each character of the line in the alphabet ...
+    idx = table[numpy.frombuffer(text.encode("ascii"), dtype = numpy.uint8)]
+    if (idx < 0).any():
+        raise ValueError(f"\"{text}\" contains characters which are not in the alphabet") from None
+
+    # Gather the glyphs and return answer ...
+    return charsArr.reshape(
+        charsArr.shape[0],
+        len(string.printable),
+        sp,
+        charsArr.shape[2],
+    )[:, idx, :, :].reshape(
+        charsArr.shape[0],
+        idx.size * sp,
+        charsArr.shape[2],
+    )
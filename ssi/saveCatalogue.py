@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def saveCatalogue(
+    catalogue,
+    jName = "studyBalticConcentration/catalogue.json",
+    /,
+):
+    """Save the catalogue of the mirror of NetCDF files
+
+    The JSON file is written to a temporary file which is then renamed, so that
+    an interrupted run never leaves behind a truncated catalogue.
+
+    Parameters
+    ----------
+    catalogue : dict
+        the catalogue
+    jName : str, optional
+        the name of the JSON file
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # **************************************************************************
+
+    # Save JSON file ...
+    with open(f"{jName}.tmp", mode = "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            catalogue,
+            fObj,
+            ensure_ascii = False,
+                  indent = 4,
+               sort_keys = True,
+        )
+    os.replace(f"{jName}.tmp", jName)
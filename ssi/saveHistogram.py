@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def saveHistogram(
+    hist,
+    stamp,
+    index,
+    /,
+    *,
+    dname = "studyBalticConcentration",
+):
+    """Save a histogram of Baltic sea ice to the store of histograms
+
+    A histogram for a new date and time is appended to the store, whereas a
+    histogram for an existing date and time overwrites its row. A histogram
+    can be removed by saving None, which overwrites its row with NaNs (which
+    are then skipped by :func:`loadHistograms`).
+
+    Parameters
+    ----------
+    hist : None, numpy.ndarray
+        the 1D array of the total area which has each concentration (in km2)
+    stamp : str
+        the date and time of the histogram (in "YYYY-MM-DD_HH-MM" format)
+    index : dict
+        the time index (as returned by :func:`loadHistogramIndex`), which is
+        updated if the histogram is appended
+    dname : str, optional
+        the directory which contains the store of histograms
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check if the store of histograms needs making ...
+    if not os.path.exists(f"{dname}/histograms.csv"):
+        # Save empty store and empty time index ...
+        with open(f"{dname}/histograms.bin", mode = "wb") as fObj:
+            pass
+        with open(f"{dname}/histograms.csv", mode = "wt", encoding = "utf-8") as fObj:
+            fObj.write("index,date and time\n")
+
+    # Check if the histogram is being removed ...
+    if hist is None:
+        hist = numpy.full(
+            101,
+            numpy.nan,
+            dtype = numpy.float64,
+        )                                                                       # [km2]
+
+    # Demonstrate how the data is arranged ...
+    assert hist.shape == (101,)
+
+    # Find the row (appending a new row after the existing rows) ...
+    row = index.get(stamp, len(index))
+
+    # Write the histogram to its row *before* appending its date and time to
+    # the time index ...
+    # NOTE: If this function was interrupted whilst appending a new row then
+    #       the partial row is overwritten next time.
+    with open(f"{dname}/histograms.bin", mode = "r+b") as fObj:
+        fObj.seek(row * 101 * numpy.dtype(numpy.float64).itemsize)
+        fObj.write(hist.astype(numpy.float64).tobytes())
+    if stamp not in index:
+        with open(f"{dname}/histograms.csv", mode = "at", encoding = "utf-8") as fObj:
+            fObj.write(f"{row:d},{stamp}\n")
+        index[stamp] = row
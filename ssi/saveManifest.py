@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def saveManifest(
+    manifest,
+    jName = "studyBalticConcentration/manifest.json",
+    /,
+):
+    """Save the manifest of the artefacts
+
+    The JSON file is written to a temporary file which is then renamed, so that
+    an interrupted run never leaves behind a truncated manifest.
+
+    Parameters
+    ----------
+    manifest : dict
+        the manifest
+    jName : str, optional
+        the name of the JSON file
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # **************************************************************************
+
+    # Save JSON file ...
+    with open(f"{jName}.tmp", mode = "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            manifest,
+            fObj,
+            ensure_ascii = False,
+                  indent = 4,
+               sort_keys = True,
+        )
+    os.replace(f"{jName}.tmp", jName)
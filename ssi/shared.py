@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+
+# Define the dictionary of (read-only) arrays which are shared with all of the
+# tasks that are run in a worker process ...
+# NOTE: This is populated once per worker process by initialiseWorker() so that
+#       the (large) reference arrays are not pickled for every single task.
+SHARED: dict = {}
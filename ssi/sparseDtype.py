@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def sparseDtype():
+    """Return the data type of the records of a sparse array
+
+    The sparse files are raw binary files of these (little-endian, packed)
+    records, which are 5 bytes each. An empty file means that the map is the
+    same as the reference map (i.e., that there is no sea ice at all).
+
+    Returns
+    -------
+    dtype : numpy.dtype
+        the data type of a record, with fields "idx" (the flat index of the
+        pixel) and "lvl" (the sea ice concentration of the pixel, in %)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Return answer ...
+    return numpy.dtype(
+        [
+            ("idx", "<u4"),
+            ("lvl", "i1"),
+        ]
+    )
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def verifyNetCDF(
+    nName,
+    /,
+):
+    """Verify the grid of a NetCDF file of Baltic sea ice concentration
+
+    This function is the task which is run (in a worker process) for each
+    NetCDF file by "step0_checkData.py" when it is only verifying the grid. The
+    NetCDF file is memory-mapped and only its header, latitudes and longitudes
+    are read (the sea ice concentrations are never read). The shape of the sea
+    ice concentrations is checked against the reference latitudes ("refLat")
+    and longitudes ("refLon") and the SHA-256 digests of the latitudes and
+    longitudes are checked against the digests of the reference latitudes
+    ("refLatDigest") and longitudes ("refLonDigest"), which were all shared
+    with the worker process by :func:`initialiseWorker`. The latitudes and
+    longitudes are only compared in full if their digests do not match.
+
+    Parameters
+    ----------
+    nName : str
+        the name of the NetCDF file
+
+    Returns
+    -------
+    result : None, bool
+        None if the NetCDF file cannot be loaded, otherwise whether the grid
+        matches the reference grid
+    """
+
+    # Import standard modules ...
+    import hashlib
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import scipy
+        import scipy.io
+    except:
+        raise Exception("\"scipy\" is not installed; run \"pip install --user scipy\"") from None
+
+    # Import sub-functions ...
+    from .shared import SHARED
+
+    # **************************************************************************
+
+    # Skip if there are errors ...
+    try:
+        # Open NetCDF file ...
+        with scipy.io.netcdf_file(nName, mode = "r", mmap = True) as fObj:
+            # Create short-hands (which are copies, so that no references to
+            # the memory-map remain when the NetCDF file is closed) ...
+            shape = fObj.variables["ice_concentration"].shape
+            lat = fObj.variables["lat"][:].astype(numpy.float32)                # [°]
+            lon = fObj.variables["lon"][:].astype(numpy.float32)                # [°]
+    except ValueError:
+        return None
+
+    # Check the dimensions ...
+    if shape != (1, SHARED["refLat"].size, SHARED["refLon"].size):
+        # Return answer ...
+        return False
+
+    # Check the fingerprints ...
+    if hashlib.sha256(lat.tobytes()).hexdigest() == SHARED["refLatDigest"] and hashlib.sha256(lon.tobytes()).hexdigest() == SHARED["refLonDigest"]:
+        # Return answer ...
+        return True
+
+    # Return answer ...
+    return bool(numpy.all(numpy.isclose(lat, SHARED["refLat"])) and numpy.all(numpy.isclose(lon, SHARED["refLon"])))
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def writeHistogram(
+    hist,
+    cName,
+    /,
+):
+    """Write a CSV histogram of Baltic sea ice concentration
+
+    This function exports a histogram from the store of histograms (see
+    :func:`loadHistograms`) to a CSV file.
+
+    Parameters
+    ----------
+    hist : numpy.ndarray
+        the 1D array of the total area which has each concentration (in km2)
+    cName : str
+        the name of the CSV file
+    """
+
+    # Open CSV file ...
+    with open(cName, mode = "wt", encoding = "utf-8") as fObj:
+        # Write header ...
+        fObj.write("sea ice concentration [%],area [km²]\n")
+
+        # Loop over concentrations ...
+        for conc in range(101):
+            # Write data ...
+            fObj.write(f"{conc:d},{hist[conc]:.15e}\n")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def writeMap(
+    lvl,
+    nName,
+    pName,
+    /,
+    *,
+    factor = 1,
+):
+    """Write a PNG map of Baltic sea ice concentration
+
+    This function is the map stage of the pipeline. It uses the flat indices of
+    the water pixels ("iWater"), the background made by :func:`renderBase`
+    ("base"), the colour lookup table ("lut"), the overlay made by
+    :func:`makeOverlay` ("overlay"), the alphabet ("charsArr" and "sp"), the
+    debug flag ("debug") and the name of the PNG encoding profile ("profile")
+    which were shared with the worker process by :func:`initialiseWorker`.
+
+    If the factor is not 1 then it writes a level of the pyramid of
+    reduced-resolution maps instead, using the level made by
+    :func:`makePyramidLevel` (one of "pyramid") and :func:`reduceMap`. The
+    levels do not have any text, as it would not fit.
+
+    Parameters
+    ----------
+    lvl : numpy.ndarray
+        the 2D array of sea ice concentrations (in %)
+    nName : str
+        the name of the NetCDF file (which is used to deduce the date and time)
+    pName : str
+        the name of the PNG file
+    factor : int, optional
+        the reduction factor (1 for the full-resolution map)
+
+    Returns
+    -------
+    msg : str
+        the size of the PNG file and how long it took to encode
+    """
+
+    # Import standard modules ...
+    import time
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.image
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from .pngProfile import pngProfile
+    from .reduceMap import reduceMap
+    from .renderMap import renderMap
+    from .renderText import renderText
+    from .shared import SHARED
+
+    # **************************************************************************
+
+    # Create short-hand ...
+    lut = SHARED["lut"]
+
+    # Check if this is a level of the pyramid ...
+    if factor != 1:
+        # Reduce the map and make the image of the level ...
+        level = SHARED["pyramid"][factor]
+        img = renderMap(reduceMap(lvl, level), level["iWater"], level["base"], lut)
+    else:
+        # Create short-hands ...
+        iWater = SHARED["iWater"]
+        base = SHARED["base"]
+        charsArr = SHARED["charsArr"]
+        overlay = SHARED["overlay"]
+        sp = SHARED["sp"]                                                       # [px]
+
+        # Make image ...
+        # NOTE: If I just wanted to make an image of the Baltic sea ice then I
+        #       could skip this step and just make a paletted image. However,
+        #       as I also want to use the colour white (for land), the colour
+        #       grey (for out-of-scope water) and the colour black (for
+        #       overlaid text) then there would be more than 256 colours in the
+        #       palette. Therefore, it must be an RGB image.
+        img = renderMap(lvl, iWater, base, lut)
+
+        # Overlay the lines of text which are on every map ...
+        # NOTE: Only the pixels which are covered by a glyph are copied,
+        #       therefore a short line does not hide the map to the right of
+        #       it.
+        mask = overlay["mask"]
+        img[1:1 + mask.shape[0], 1:1 + mask.shape[1], :][mask, :] = overlay["tile"][mask, :]
+
+        # Overlay the date and time below them ...
+        stub = nName.split("_")[-1].removesuffix(".nc")
+        text = renderText(f"{stub[0:4]}-{stub[4:6]}-{stub[6:8]} {stub[8:10]}:{stub[10:12]}", charsArr, sp)
+        iy = 1 + mask.shape[0]                                                  # [px]
+        img[iy:iy + text.shape[0], 1:1 + text.shape[1], :] = text
+
+    # Make PNG ...
+    start = time.perf_counter()                                                 # [s]
+    src = pyguymer3.image.makePng(
+        img,
+           debug = SHARED["debug"],
+             dpi = None,
+         modTime = None,
+        palUint8 = None,
+        **pngProfile(SHARED["profile"]),
+    )
+    duration = time.perf_counter() - start                                      # [s]
+    with open(pName, mode = "wb") as fObj:
+        fObj.write(src)
+
+    # Return answer ...
+    return f" > Encoded {len(src):,d} bytes in {duration:.3f}s (using the \"{SHARED['profile']}\" profile)."
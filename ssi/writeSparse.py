@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def writeSparse(
+    lvl,
+    sName,
+    /,
+):
+    """Write a sparse file of Baltic sea ice concentration
+
+    This function is the sparse stage of the pipeline. It uses the reference
+    map ("refLvl") which was shared with the worker process by
+    :func:`initialiseWorker`.
+
+    Parameters
+    ----------
+    lvl : numpy.ndarray
+        the 2D array of sea ice concentrations (in %)
+    sName : str
+        the name of the sparse file
+    """
+
+    # Import sub-functions ...
+    from .encodeSparse import encodeSparse
+    from .shared import SHARED
+
+    # **************************************************************************
+
+    # Save BIN file ...
+    encodeSparse(lvl, SHARED["refLvl"]).tofile(sName)
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import json
+    import multiprocessing
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import PIL
+        import PIL.Image
+        PIL.Image.MAX_IMAGE_PIXELS = 1024 * 1024 * 1024                         # [px]
+    except:
+        raise Exception("\"PIL\" is not installed; run \"pip install --user Pillow\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    import ssi
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Check, make maps of, make histograms of and make sparse files of Baltic sea ice, loading each NetCDF file only once.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           dest = "jobs",
+           help = "the number of worker processes to use",
+           type = int,
+    )
+    parser.add_argument(
+        "--latest",
+        action = "store_true",
+          help = "only process the last NetCDF file for each day (which is the only one that steps 3 and 4 use)",
+    )
+    parser.add_argument(
+        "--profile",
+        choices = [
+            "archival",
+            "fast",
+        ],
+        default = "archival",
+           dest = "profile",
+           help = "the PNG encoding profile (\"archival\" tries every PNG filter at zlib level 9, \"fast\" only tries one PNG filter at zlib level 1)",
+           type = str,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Define character spacing ...
+    sp = 12                                                                     # [px]
+
+    # Open image as RGB (even if it is paletted) and convert it to a NumPy array ...
+    with PIL.Image.open("makeAlphabet.png") as iObj:
+        charsImg = iObj.convert("RGB")
+    charsArr = numpy.array(charsImg)
+    del charsImg
+
+    # Render the lines of text which are on every map once ...
+    overlay = ssi.makeOverlay(
+        [
+            "Baltic Sea - Sea Ice Concentration",
+            "Credits: E.U. Copernicus Marine Service Information",
+            "",
+        ],
+        charsArr,
+        sp,
+    )
+
+    # Load colour tables and create short-hand ...
+    with open(f"{pyguymer3.__path__[0]}/data/json/colourTables.json", mode = "rt", encoding = "utf-8") as fObj:
+        colourTables = json.load(fObj)
+    turbo = numpy.array(colourTables["turbo"]).astype(numpy.uint8)
+
+    # Make colour lookup table ...
+    lut = ssi.makeLut(turbo)
+
+    # **************************************************************************
+
+    # Make output directories ...
+    if not os.path.exists("studyBalticConcentration"):
+        os.mkdir("studyBalticConcentration")
+    if not os.path.exists("studyBalticConcentration/maps"):
+        os.mkdir("studyBalticConcentration/maps")
+    if not os.path.exists("studyBalticConcentration/sparse"):
+        os.mkdir("studyBalticConcentration/sparse")
+
+    print("Refreshing \"studyBalticConcentration/catalogue.json\" ...")
+
+    # Load the catalogue of the mirror, refresh it and save it ...
+    catalogue = ssi.loadCatalogue()
+    nDirs = ssi.refreshCatalogue(catalogue)
+    ssi.saveCatalogue(catalogue)
+    print(f" > Listed {nDirs:,d} month directories; the mirror has {len(catalogue['files']):,d} NetCDF files.")
+
+    print("Loading \"studyBalticConcentration/lat.bin\" ...")
+
+    # Load BIN file ...
+    refLat = numpy.fromfile(
+        "studyBalticConcentration/lat.bin",
+        dtype = numpy.float32,
+    )                                                                           # [°]
+
+    print("Loading \"studyBalticConcentration/lon.bin\" ...")
+
+    # Load BIN file ...
+    refLon = numpy.fromfile(
+        "studyBalticConcentration/lon.bin",
+        dtype = numpy.float32,
+    )                                                                           # [°]
+
+    print("Loading \"studyBalticConcentration/conc.bin\" ...")
+
+    # Load BIN file ...
+    refLvl = numpy.fromfile(
+        "studyBalticConcentration/conc.bin",
+        dtype = numpy.int8,
+    ).reshape(refLat.size, refLon.size)                                         # [%]
+
+    print("Loading \"studyBalticConcentration/water.bin\" and \"studyBalticConcentration/weights.bin\" ...")
+
+    # Load the flat indices of the water pixels and the area of each of them ...
+    iWater, weights = ssi.loadWater()                                           # [km2]
+
+    # Render the land and the out-of-scope water once ...
+    base = ssi.renderBase(refLvl, lut)
+
+    # Load manifest ...
+    manifest = ssi.loadManifest()
+
+    print("Loading \"studyBalticConcentration/histograms.csv\" ...")
+
+    # Load the time index of the store of histograms and find which histograms
+    # are in it (as a set, for fast look-ups) ...
+    index = ssi.loadHistogramIndex()
+    stamps, _ = ssi.loadHistograms()
+    stamps = set(stamps)
+
+    # **************************************************************************
+
+    # Create pool of workers and share the reference arrays with them ...
+    with multiprocessing.Pool(
+          processes = args.jobs,
+        initializer = ssi.initialiseWorker,
+           initargs = (
+            {
+                    "base" : base,
+                "charsArr" : charsArr,
+                   "debug" : args.debug,
+                  "iWater" : iWater,
+                     "lut" : lut,
+                 "overlay" : overlay,
+                 "profile" : args.profile,
+                  "refLat" : refLat,
+                  "refLon" : refLon,
+                  "refLvl" : refLvl,
+                      "sp" : sp,
+                 "weights" : weights,
+            },
+        ),
+    ) as pool:
+        # Initialize list ...
+        results = []
+
+        # Loop over NetCDF files ...
+        for stamp, nName in ssi.planNetCDFs(catalogue["files"], latest = args.latest):
+            # Deduce image name, histogram name and sparse name ...
+            pName = f"studyBalticConcentration/maps/{stamp}.png"
+            hName = f"studyBalticConcentration/histograms.bin:{stamp}"
+            sName = f"studyBalticConcentration/sparse/{stamp}.bin"
+
+            # Find which of them need making ...
+            # NOTE: The histogram is not a file, it is a row in the store of
+            #       histograms.
+            # NOTE: If the NetCDF file is already known to be corrupt then none
+            #       of them can be made and if it is already known to not have
+            #       any sea ice then only the sparse file can be made.
+            status = ssi.fileStatus(catalogue, nName)
+            todo = {}
+            for kind, oName, exists in [
+                ("histogram", hName, stamp in stamps),
+                ("map", pName, None),
+                ("sparse", sName, None),
+            ]:
+                if status == "corrupt" or (status == "no ice" and kind != "sparse"):
+                    # Remove any stale artefact (which was made from a previous
+                    # version of the NetCDF file) ...
+                    if oName == hName:
+                        if stamp in stamps:
+                            print(f"Removing stale \"{oName}\" ...")
+                            ssi.saveHistogram(None, stamp, index)
+                    elif os.path.exists(oName):
+                        print(f"Removing stale \"{oName}\" ...")
+                        os.remove(oName)
+                    manifest.pop(oName, None)
+                    continue
+                iNames, version = ssi.dependencies(kind, nName, profile = args.profile)
+                if ssi.needsMaking(manifest, oName, iNames, version, catalogue = catalogue, exists = exists):
+                    todo[oName] = (iNames, version)
+
+            # Skip if they are all up-to-date ...
+            if len(todo) == 0:
+                continue
+
+            # Add job to pool ...
+            # NOTE: If the histogram is the only artefact which needs making
+            #       then the sparse file is up-to-date, therefore the histogram
+            #       is made from it rather than from the NetCDF file.
+            results.append(
+                (
+                    nName,
+                    stamp,
+                    hName,
+                    todo,
+                    pool.apply_async(
+                        ssi.processNetCDF,
+                        (
+                            nName,
+                            pName if pName in todo else None,
+                            hName if hName in todo else None,
+                            sName if sName in todo else None,
+                        ),
+                        {
+                            "sparse" : sName if list(todo) == [hName] else None,
+                        },
+                    ),
+                )
+            )
+
+        # Loop over results (in the same order that they were added) ...
+        for i, (nName, stamp, hName, todo, result) in enumerate(results):
+            print(f"Processing \"{nName}\" ...")
+
+            # Wait for the job to finish, print what it did and record the
+            # status of the NetCDF file ...
+            status, msgs, made, hist = result.get()                             # [km2]
+            for msg in msgs:
+                print(msg)
+            ssi.recordStatus(catalogue, nName, status)
+
+            # Save the histogram to the store (if it was made) ...
+            if hist is not None:
+                ssi.saveHistogram(hist, stamp, index)
+
+            # Loop over the artefacts which needed making ...
+            for oName, (iNames, version) in todo.items():
+                # Check if the artefact was made ...
+                if oName in made:
+                    # Record the artefact in the manifest ...
+                    ssi.recordArtefact(manifest, oName, iNames, version)
+                else:
+                    # Remove any stale artefact (which was made from a previous
+                    # version of the NetCDF file) ...
+                    if oName == hName:
+                        if stamp in stamps:
+                            print(f" > Removing stale \"{oName}\".")
+                            ssi.saveHistogram(None, stamp, index)
+                    elif os.path.exists(oName):
+                        print(f" > Removing stale \"{oName}\".")
+                        os.remove(oName)
+                    manifest.pop(oName, None)
+
+            # Save the manifest and the catalogue every so often (so that not
+            # much is lost if this script is interrupted) ...
+            if (i + 1) % 100 == 0:
+                ssi.saveManifest(manifest)
+                ssi.saveCatalogue(catalogue)
+
+        # Close the pool of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of "multiprocessing.Pool" calls
+        #       "terminate()" instead of "join()".
+        pool.close()
+        pool.join()
+
+    # Save manifest and catalogue ...
+    ssi.saveManifest(manifest)
+    ssi.saveCatalogue(catalogue)
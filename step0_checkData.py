@@ -7,6 +7,8 @@ if __name__ == "__main__":
     import argparse
     import copy
     import glob
+    import hashlib
+    import multiprocessing
     import os
 
     # Import special modules ...
@@ -14,23 +16,14 @@ if __name__ == "__main__":
         import numpy
     except:
         raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
-    try:
-        import scipy
-    except:
-        raise Exception("\"scipy\" is not installed; run \"pip install --user scipy\"") from None
-    try:
-        import shapely
-        import shapely.geometry
-    except:
-        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
 
     # Import my modules ...
     try:
         import pyguymer3
-        import pyguymer3.geo
         import pyguymer3.image
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    import ssi
 
     # **************************************************************************
 
@@ -59,6 +52,17 @@ if __name__ == "__main__":
            help = "the number of levels to split shapes into when calculating their area",
            type = int,
     )
+    parser.add_argument(
+        "--method",
+        choices = [
+            "analytic",
+            "vincenty",
+        ],
+        default = "analytic",
+           dest = "method",
+           help = "the method to calculate the area of the pixels with (\"analytic\" takes seconds, \"vincenty\" takes hours)",
+           type = str,
+    )
     parser.add_argument(
         "--nIter",
         default = 1000000,
@@ -66,6 +70,66 @@ if __name__ == "__main__":
            help = "the maximum number of iterations (particularly the Vincenty formula)",
            type = int,
     )
+    parser.add_argument(
+        "--nRows",
+        default = 8,
+           dest = "nRows",
+           help = "the number of rows of pixels in each checkpointed chunk when using the Vincenty formula",
+           type = int,
+    )
+    parser.add_argument(
+        "--nSample",
+        default = 100,
+           dest = "nSample",
+           help = "the number of pixels to cross-check with the Vincenty formula when using the analytic method",
+           type = int,
+    )
+    parser.add_argument(
+        "--profile",
+        choices = [
+            "archival",
+            "fast",
+        ],
+        default = "archival",
+           dest = "profile",
+           help = "the PNG encoding profile (\"archival\" tries every PNG filter at zlib level 9, \"fast\" only tries one PNG filter at zlib level 1)",
+           type = str,
+    )
+    parser.add_argument(
+        "--tol",
+        default = 1.0e-4,
+           dest = "tol",
+           help = "the maximum relative difference allowed between the analytic and the Vincenty areas of a pixel",
+           type = float,
+    )
+    parser.add_argument(
+        "--fast",
+        action = "store_true",
+          help = "only verify the grid of each NetCDF file (from its header, latitudes and longitudes, without reading its sea ice concentrations), which needs the reference grid and map to have been made by a previous run",
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           dest = "jobs",
+           help = "the number of worker processes to use",
+           type = int,
+    )
+    parser.add_argument(
+        "--latest",
+        action = "store_true",
+          help = "only process the last NetCDF file for each day (which is the only one that steps 3 and 4 use)",
+    )
+    parser.add_argument(
+        "--per-cell",
+        action = "store_true",
+          dest = "perCell",
+          help = "also save the area of every grid point to \"studyBalticConcentration/cellAreas.bin\" and weight the histograms with it (rather than with the area of a grid point in each row)",
+    )
+    parser.add_argument(
+        "--rescan",
+        action = "store_true",
+          help = "list every month directory of the mirror, even if its modification time is unchanged (which is needed if \"lftp mirror\" overwrites NetCDF files in place)",
+    )
     args = parser.parse_args()
 
     # **************************************************************************
@@ -74,6 +138,14 @@ if __name__ == "__main__":
     if not os.path.exists("studyBalticConcentration"):
         os.mkdir("studyBalticConcentration")
 
+    print("Refreshing \"studyBalticConcentration/catalogue.json\" ...")
+
+    # Load the catalogue of the mirror, refresh it and save it ...
+    catalogue = ssi.loadCatalogue()
+    nDirs = ssi.refreshCatalogue(catalogue, full = args.rescan)
+    ssi.saveCatalogue(catalogue)
+    print(f" > Listed {nDirs:,d} month directories; the mirror has {len(catalogue['files']):,d} NetCDF files.")
+
     # **************************************************************************
 
     # Check if the BIN file needs making ...
@@ -104,8 +176,9 @@ if __name__ == "__main__":
 
     # Check if the BIN file needs making ...
     if not os.path.exists("studyBalticConcentration/conc.bin"):
-        # Create short-hand ...
+        # Create short-hands ...
         conc = None
+        concDigest = None
     else:
         print("Loading \"studyBalticConcentration/conc.bin\" ...")
 
@@ -114,170 +187,333 @@ if __name__ == "__main__":
             "studyBalticConcentration/conc.bin",
             dtype = numpy.int8,
         ).reshape(1, lat.size, lon.size)                                        # [%]
+        concDigest = hashlib.sha256(conc.tobytes()).hexdigest()
+
+    # Check if only the grid should be verified but the reference grid and map
+    # have not been made yet ...
+    fast = args.fast
+    if fast and (lat is None or lon is None or conc is None):
+        print("WARNING: The reference grid and map have not been made yet, therefore every NetCDF file will be checked in full.")
+        fast = False
+
+    # Create pool of workers and share the reference grid with them ...
+    with multiprocessing.Pool(
+          processes = args.jobs,
+        initializer = ssi.initialiseWorker,
+           initargs = (
+            {
+                      "refLat" : lat,
+                "refLatDigest" : None if lat is None else hashlib.sha256(lat.tobytes()).hexdigest(),
+                      "refLon" : lon,
+                "refLonDigest" : None if lon is None else hashlib.sha256(lon.tobytes()).hexdigest(),
+            },
+        ),
+    ) as pool:
+        # Initialize list ...
+        results = []
+
+        # Loop over NetCDF files ...
+        for _, nName in ssi.planNetCDFs(catalogue["files"], latest = args.latest):
+            # Skip this NetCDF file if it is already known to be corrupt ...
+            if ssi.fileStatus(catalogue, nName) == "corrupt":
+                continue
+
+            # Add job to pool ...
+            results.append(
+                (
+                    nName,
+                    pool.apply_async(
+                        ssi.verifyNetCDF if fast else ssi.checkNetCDF,
+                        (nName,),
+                    ),
+                )
+            )
+
+        # Loop over results (in the same order that they were added) ...
+        for nName, result in results:
+            print(f"Checking \"{nName}\" ...")
+
+            # Wait for the job to finish ...
+            ans = result.get()
+
+            # Check if only the grid was verified ...
+            if fast:
+                # Skip if there were errors ...
+                if ans is None:
+                    print(" > Skipping, error loading NetCDF.")
+                    ssi.recordStatus(catalogue, nName, "corrupt")
+                    continue
+
+                # Check grid ...
+                assert ans
+                continue
+
+            # Record the status of the NetCDF file ...
+            if ans is None:
+                ssi.recordStatus(catalogue, nName, "corrupt")
+            elif ans[2]:
+                ssi.recordStatus(catalogue, nName, "ok")
+            else:
+                ssi.recordStatus(catalogue, nName, "no ice")
+
+            # Skip if there were errors ...
+            if ans is None:
+                print(" > Skipping, error loading NetCDF.")
+                continue
+            tmpLat, tmpLon, hasIce, tmpDigest = ans                             # [°], [°]
+
+            # Check if the short-hands have been populated ...
+            if lat is None and lon is None:
+                # Check if the BIN file needs making ...
+                if not os.path.exists("studyBalticConcentration/lat.bin"):
+                    print("Making \"studyBalticConcentration/lat.bin\" ...")
+
+                    # Save BIN file ...
+                    tmpLat.tofile("studyBalticConcentration/lat.bin")
 
-    # Loop over NetCDF files ...
-    for nName in sorted(glob.glob("Copernicus/SEAICE_BAL_SEAICE_L4_NRT_OBSERVATIONS_011_004/FMI-BAL-SEAICE_CONC-L4-NRT-OBS/????/??/ice_conc_baltic_????????????.nc")):
-        print(f"Checking \"{nName}\" ...")
-
-        # Skip if there are errors ...
-        try:
-            # Open NetCDF file ...
-            with scipy.io.netcdf_file(nName, mode = "r") as fObj:
-                # Create short-hands ...
-                tmpLat = numpy.array(fObj.variables["lat"][:]).astype(numpy.float32)    # [°]
-                tmpLon = numpy.array(fObj.variables["lon"][:]).astype(numpy.float32)    # [°]
-                tmpConc = numpy.array(fObj.variables["ice_concentration"][:, :, :]).astype(numpy.int8)  # [%]
-        except ValueError:
-            print(" > Skipping, error loading NetCDF.")
-            continue
-
-        # Demonstrate how the data is arranged ...
-        assert len(tmpLat.shape) == 1
-        assert len(tmpLon.shape) == 1
-        assert len(tmpConc.shape) == 3
-        assert tmpConc.shape == (1, tmpLat.size, tmpLon.size)
-
-        # Check if the short-hands have been populated ...
-        if lat is None and lon is None:
-            # Check if the BIN file needs making ...
-            if not os.path.exists("studyBalticConcentration/lat.bin"):
-                print("Making \"studyBalticConcentration/lat.bin\" ...")
-
-                # Save BIN file ...
-                tmpLat.tofile("studyBalticConcentration/lat.bin")
-
-            # Check if the BIN file needs making ...
-            if not os.path.exists("studyBalticConcentration/lon.bin"):
-                print("Making \"studyBalticConcentration/lon.bin\" ...")
-
-                # Save BIN file ...
-                tmpLon.tofile("studyBalticConcentration/lon.bin")
-
-            # Populate short-hands ...
-            lat = copy.copy(tmpLat)                                             # [°]
-            lon = copy.copy(tmpLon)                                             # [°]
-        else:
-            # Check values ...
-            assert numpy.all(numpy.isclose(tmpLat, lat))
-            assert numpy.all(numpy.isclose(tmpLon, lon))
-
-        # Check if there isn't any sea ice in this NetCDF file ...
-        if tmpConc.max() <= 0:
-            # Check if the short-hand has been populated ...
-            if conc is None:
                 # Check if the BIN file needs making ...
-                if not os.path.exists("studyBalticConcentration/conc.bin"):
-                    print("Making \"studyBalticConcentration/conc.bin\" ...")
+                if not os.path.exists("studyBalticConcentration/lon.bin"):
+                    print("Making \"studyBalticConcentration/lon.bin\" ...")
 
                     # Save BIN file ...
-                    tmpConc.tofile("studyBalticConcentration/conc.bin")
-
-                # Check if the PNG file needs making ...
-                if not os.path.exists("studyBalticConcentration/conc.png"):
-                    print("Making \"studyBalticConcentration/conc.png\" ...")
-
-                    # Make an array suitable to be saved as a paletted PNG ...
-                    tmpArr = numpy.zeros(
-                        (tmpLat.size, tmpLon.size, 1),
-                        dtype = numpy.uint8,
-                    )
-                    for iLat in range(tmpLat.size):
-                        for iLon in range(tmpLon.size):
-                            match tmpConc[0, iLat, iLon]:
-                                case 0:                                         # water
-                                    tmpArr[iLat, iLon, 0] = 0                   # water
-                                case -99:                                       # land
-                                    tmpArr[iLat, iLon, 0] = 1                   # land
-                                case -59:                                       # out-of-scope water
-                                    tmpArr[iLat, iLon, 0] = 2                   # out-of-scope water
-                                case _:
-                                    raise ValueError(f"{tmpConc[0, iLat, iLon]:d} is not an expected value") from None
-
-                    # Save PNG file ...
-                    tmpSrc = pyguymer3.image.makePng(
-                        tmpArr,
-                        calcAdaptive = True,
-                         calcAverage = True,
-                            calcNone = True,
-                           calcPaeth = True,
-                             calcSub = True,
-                              calcUp = True,
-                             choices = "all",
+                    tmpLon.tofile("studyBalticConcentration/lon.bin")
+
+                # Populate short-hands ...
+                lat = copy.copy(tmpLat)                                         # [°]
+                lon = copy.copy(tmpLon)                                         # [°]
+            else:
+                # Check values ...
+                assert numpy.all(numpy.isclose(tmpLat, lat))
+                assert numpy.all(numpy.isclose(tmpLon, lon))
+
+            # Check if there isn't any sea ice in this NetCDF file ...
+            if not hasIce:
+                # Check if the short-hand has been populated ...
+                if conc is None:
+                    # Load NetCDF file (again) ...
+                    # NOTE: Only the digest of the sea ice concentrations was
+                    #       sent back from the worker process.
+                    _, _, tmpConc = ssi.loadNetCDF(nName)                       # [%]
+
+                    # Check if the BIN file needs making ...
+                    if not os.path.exists("studyBalticConcentration/conc.bin"):
+                        print("Making \"studyBalticConcentration/conc.bin\" ...")
+
+                        # Save BIN file ...
+                        tmpConc.tofile("studyBalticConcentration/conc.bin")
+
+                    # Check if the PNG file needs making ...
+                    if not os.path.exists("studyBalticConcentration/conc.png"):
+                        print("Making \"studyBalticConcentration/conc.png\" ...")
+
+                        # Make an array suitable to be saved as a paletted PNG ...
+                        tmpArr = ssi.classifyPixels(tmpConc[0, :, :])[:, :, numpy.newaxis]
+
+                        # Save PNG file ...
+                        tmpSrc = pyguymer3.image.makePng(
+                            tmpArr,
                                debug = args.debug,
                                  dpi = None,
-                              levels = [9,],
-                           memLevels = [9,],
                              modTime = None,
                             palUint8 = numpy.array(
-                            [
-                                [  0,   0, 255],                                # blue
-                                [  0, 255,   0],                                # green
-                                [255,   0,   0],                                # red
-                            ],
-                            dtype = numpy.uint8,
-                        ),
-                          strategies = None,
-                              wbitss = [15,],
-                    )
-                    del tmpArr
-                    with open("studyBalticConcentration/conc.png", mode = "wb") as fObj:
-                        fObj.write(tmpSrc)
-                    del tmpSrc
-
-                # Populate short-hand ...
-                conc = copy.copy(tmpConc)                                       # [%]
-            elif not numpy.all(tmpConc == conc):
-                # Cry ...
-                print(f"WARNING: \"{nName}\" does't have any concentration and it disagrees with the standard map.")
+                                [
+                                    [  0,   0, 255],                            # blue
+                                    [  0, 255,   0],                            # green
+                                    [255,   0,   0],                            # red
+                                ],
+                                dtype = numpy.uint8,
+                            ),
+                            **ssi.pngProfile(args.profile),
+                        )
+                        del tmpArr
+                        with open("studyBalticConcentration/conc.png", mode = "wb") as fObj:
+                            fObj.write(tmpSrc)
+                        del tmpSrc
+
+                    # Populate short-hands ...
+                    conc = copy.copy(tmpConc)                                   # [%]
+                    concDigest = tmpDigest
+                    del tmpConc
+                elif tmpDigest != concDigest:
+                    # Cry ...
+                    print(f"WARNING: \"{nName}\" does't have any concentration and it disagrees with the standard map.")
+
+        # Close the pool of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of "multiprocessing.Pool" calls
+        #       "terminate()" instead of "join()".
+        pool.close()
+        pool.join()
+
+    # Save the catalogue ...
+    ssi.saveCatalogue(catalogue)
 
     # **************************************************************************
 
+    # Check that the reference grid has been made ...
+    # NOTE: It is made from the first NetCDF file which is not corrupt.
+    if lat is None or lon is None:
+        raise Exception("\"studyBalticConcentration/lat.bin\" and \"studyBalticConcentration/lon.bin\" have not been made yet (none of the NetCDF files could be loaded), therefore the area of the pixels cannot be found") from None
+
     # Check if the BIN file needs making ...
     if not os.path.exists("studyBalticConcentration/areas.bin"):
         print("Calculating the area of the pixels ...")
 
-        # Calculate the area of each pixel assuming that the data is point-wise ...
-        # NOTE: The progress string needs padding with extra spaces so that the
-        #       line is fully overwritten when it inevitably gets shorter (as
-        #       the remaining time gets shorter). Assume that the longest it
-        #       will ever be is "???.???% (~??h ??m ??.?s still to go)" (which
-        #       is 37 characters).
-        areas = numpy.zeros(
-            (lat.size - 1, lon.size - 1),
-            dtype = numpy.float32,
-        )                                                                       # [km2]
-        start = pyguymer3.now()
-        for iLat in range(lat.size - 1):
-            for iLon in range(lon.size - 1):
-                pixel = shapely.geometry.polygon.Polygon(
-                    shapely.geometry.polygon.LinearRing(
-                        [
-                            (lon[iLon    ], lat[iLat    ]),
-                            (lon[iLon    ], lat[iLat + 1]),
-                            (lon[iLon + 1], lat[iLat + 1]),
-                            (lon[iLon + 1], lat[iLat    ]),
-                            (lon[iLon    ], lat[iLat    ]),
-                        ]
-                    )
-                )
-                areas[iLat, iLon] = pyguymer3.geo.area(
-                    pixel,
-                      eps = args.eps,
-                    level = args.level,
-                    nIter = args.nIter,
-                ) / 1.0e6                                                       # [km2]
-            fraction = float(iLat + 1) / float(lat.size - 1)
-            durationSoFar = pyguymer3.now() - start
-            totalDuration = durationSoFar / fraction
-            remaining = (totalDuration - durationSoFar).total_seconds()         # [s]
-            progress = f"{100.0 * fraction:.3f}% (~{pyguymer3.convert_seconds_to_pretty_time(remaining)} still to go)"
-            print(f"  {progress:37s}", end = "\r")
-        print()
+        # Check which method to use ...
+        match args.method:
+            case "analytic":
+                # Calculate the area of each pixel assuming that the data is
+                # point-wise and that each pixel is an ellipsoidal quadrangle ...
+                areas = ssi.calcAreas(lat, lon).astype(numpy.float32)           # [km2]
+
+                print(f"Cross-checking {args.nSample:,d} pixels with the Vincenty formula ...")
+
+                # Calculate the area of a sample of pixels, spread over all of
+                # the rows and all of the columns, using the Vincenty formula
+                # and find the largest relative difference ...
+                maxDiff = 0.0
+                for iLat, iLon in zip(
+                    numpy.linspace(0, lat.size - 2, num = args.nSample, dtype = numpy.int64),
+                    numpy.linspace(0, lon.size - 2, num = args.nSample, dtype = numpy.int64)[::-1],
+                    strict = True,
+                ):
+                    area = ssi.calcPixelArea(
+                        lat,
+                        lon,
+                        iLat,
+                        iLon,
+                          eps = args.eps,
+                        level = args.level,
+                        nIter = args.nIter,
+                    )                                                           # [km2]
+                    maxDiff = max(maxDiff, abs(float(areas[iLat, iLon]) - area) / area)
+                print(f"The largest relative difference is {maxDiff:.3e} (the tolerance is {args.tol:.3e}).")
+
+                # Check the largest relative difference ...
+                if maxDiff > args.tol:
+                    raise Exception(f"the analytic areas disagree with the Vincenty formula ({maxDiff:.3e} > {args.tol:.3e})") from None
+            case "vincenty":
+                # Make checkpoint directory ...
+                if not os.path.exists("studyBalticConcentration/areaChunks"):
+                    os.mkdir("studyBalticConcentration/areaChunks")
+
+                # Loop over temporary chunks ...
+                for tName in sorted(glob.glob("studyBalticConcentration/areaChunks/*.bin.tmp")):
+                    # Remove the temporary chunk (which was left behind by a
+                    # previous run which was interrupted) ...
+                    print(f"Removing stale \"{tName}\" ...")
+                    os.remove(tName)
+
+                # Split the rows of pixels into chunks ...
+                chunks = [
+                    (iLat0, min(iLat0 + args.nRows, lat.size - 1))
+                    for iLat0 in range(0, lat.size - 1, args.nRows)
+                ]
+
+                # Create pool of workers and share the reference grid and the
+                # settings of the Vincenty formula with them ...
+                with multiprocessing.Pool(
+                      processes = args.jobs,
+                    initializer = ssi.initialiseWorker,
+                       initargs = (
+                        {
+                               "eps" : args.eps,
+                             "level" : args.level,
+                             "nIter" : args.nIter,
+                            "refLat" : lat,
+                            "refLon" : lon,
+                        },
+                    ),
+                ) as pool:
+                    # Initialize list and counter ...
+                    chunkResults = []
+                    nDone = lat.size - 1
+
+                    # Loop over chunks ...
+                    for iLat0, iLat1 in chunks:
+                        # Skip if it was checkpointed by a previous run ...
+                        cName = f"studyBalticConcentration/areaChunks/{iLat0:04d}-{iLat1:04d}.bin"
+                        if os.path.exists(cName):
+                            continue
+
+                        # Add job to pool ...
+                        chunkResults.append(
+                            (
+                                iLat1 - iLat0,
+                                pool.apply_async(
+                                    ssi.calcAreaChunk,
+                                    (iLat0, iLat1, cName),
+                                ),
+                            )
+                        )
+                        nDone -= iLat1 - iLat0
+                    if nDone > 0:
+                        print(f"Resuming from {nDone:,d} of {lat.size - 1:,d} rows of pixels (which were checkpointed by a previous run) ...")
+
+                    # Loop over results (in the same order that they were
+                    # added) ...
+                    # NOTE: Each chunk is checkpointed by the worker process as
+                    #       soon as it is finished, therefore a chunk which
+                    #       finishes before an earlier one is not lost if this
+                    #       script is interrupted.
+                    # NOTE: The progress string needs padding with extra spaces
+                    #       so that the line is fully overwritten when it
+                    #       inevitably gets shorter (as the remaining time gets
+                    #       shorter). Assume that the longest it will ever be is
+                    #       "???.???% (??,???.? px/s, ~??h ??m ??.?s still to go)"
+                    #       (which is 52 characters).
+                    # NOTE: The throughput is the aggregate throughput of all of
+                    #       the worker processes during this run (i.e., it
+                    #       ignores the checkpointed rows of pixels).
+                    nNew = 0
+                    start = pyguymer3.now()
+                    for nRows, result in chunkResults:
+                        # Wait for the job to finish ...
+                        result.get()
+                        nNew += nRows
+
+                        # Print progress ...
+                        fraction = float(nDone + nNew) / float(lat.size - 1)
+                        durationSoFar = (pyguymer3.now() - start).total_seconds()   # [s]
+                        rate = float(nNew * (lon.size - 1)) / max(durationSoFar, 1.0e-6)    # [px/s]
+                        remaining = float((lat.size - 1 - nDone - nNew) * (lon.size - 1)) / rate    # [s]
+                        progress = f"{100.0 * fraction:.3f}% ({rate:,.1f} px/s, ~{pyguymer3.convert_seconds_to_pretty_time(remaining)} still to go)"
+                        print(f"  {progress:52s}", end = "\r")
+                    if nNew > 0:
+                        print()
+
+                    # Close the pool of worker processes and wait for all of
+                    # the tasks to finish ...
+                    # NOTE: The "__exit__()" call of "multiprocessing.Pool"
+                    #       calls "terminate()" instead of "join()".
+                    pool.close()
+                    pool.join()
+
+                # Assemble the area of each pixel from the checkpointed
+                # chunks ...
+                areas = numpy.zeros(
+                    (lat.size - 1, lon.size - 1),
+                    dtype = numpy.float32,
+                )                                                               # [km2]
+                for iLat0, iLat1 in chunks:
+                    areas[iLat0:iLat1, :] = numpy.fromfile(
+                        f"studyBalticConcentration/areaChunks/{iLat0:04d}-{iLat1:04d}.bin",
+                        dtype = numpy.float32,
+                    ).reshape(iLat1 - iLat0, lon.size - 1)                      # [km2]
+            case _:
+                # Crash ...
+                raise ValueError(f"\"{args.method}\" is not a recognised method") from None
 
         print("Making \"studyBalticConcentration/areas.bin\" ...")
 
         # Save BIN file ...
         areas.tofile("studyBalticConcentration/areas.bin")
+
+        # Remove the checkpointed chunks (now that they are not needed) ...
+        if os.path.exists("studyBalticConcentration/areaChunks"):
+            for cName in sorted(glob.glob("studyBalticConcentration/areaChunks/*.bin") + glob.glob("studyBalticConcentration/areaChunks/*.bin.tmp")):
+                os.remove(cName)
+            os.rmdir("studyBalticConcentration/areaChunks")
     else:
         print("Loading \"studyBalticConcentration/areas.bin\" ...")
 
@@ -319,3 +555,61 @@ if __name__ == "__main__":
             fObj.write(f"    {coef[1]:.15e},\n")
             fObj.write(f"    {coef[2]:.15e}\n")
             fObj.write("]")
+
+    # **************************************************************************
+
+    # Initialize flag ...
+    remake = False
+
+    # Check if the BIN file needs making ...
+    if not os.path.exists("studyBalticConcentration/rowAreas.bin"):
+        print("Making \"studyBalticConcentration/rowAreas.bin\" ...")
+
+        # Save BIN file of the area of a grid point in each row ...
+        ssi.regridAreas(areas).tofile("studyBalticConcentration/rowAreas.bin")
+        remake = True
+
+    # Check if the BIN file needs making ...
+    if args.perCell and not os.path.exists("studyBalticConcentration/cellAreas.bin"):
+        print("Making \"studyBalticConcentration/cellAreas.bin\" ...")
+
+        # Save BIN file of the area of every grid point ...
+        ssi.regridAreas(areas, perCell = True).tofile("studyBalticConcentration/cellAreas.bin")
+        remake = True
+
+    # Check if the BIN files need making ...
+    if remake or not os.path.exists("studyBalticConcentration/water.bin") or not os.path.exists("studyBalticConcentration/weights.bin"):
+        print("Making \"studyBalticConcentration/water.bin\" and \"studyBalticConcentration/weights.bin\" ...")
+
+        # Check that the reference map has been made ...
+        # NOTE: It is only made from a NetCDF file which does not have any sea
+        #       ice, therefore it may not have been made yet.
+        if conc is None:
+            raise Exception("\"studyBalticConcentration/conc.bin\" has not been made yet (none of the NetCDF files are free of sea ice), therefore the water pixels cannot be found") from None
+
+        # Load the area of every grid point, if it has been made, otherwise load
+        # the area of a grid point in each row ...
+        if os.path.exists("studyBalticConcentration/cellAreas.bin"):
+            pixelAreas = numpy.memmap(
+                "studyBalticConcentration/cellAreas.bin",
+                dtype = numpy.float64,
+                 mode = "r",
+                shape = (lat.size, lon.size),
+            )                                                                   # [km2]
+        else:
+            pixelAreas = numpy.memmap(
+                "studyBalticConcentration/rowAreas.bin",
+                dtype = numpy.float64,
+                 mode = "r",
+                shape = (lat.size,),
+            )                                                                   # [km2]
+
+        # Find the flat indices of the water pixels and the area of each of
+        # them ...
+        iWater, weights = ssi.calcWater(conc[0, :, :], pixelAreas)              # [km2]
+        del pixelAreas
+
+        # Save BIN files ...
+        iWater.astype("<u4").tofile("studyBalticConcentration/water.bin")
+        weights.tofile("studyBalticConcentration/weights.bin")
+        del iWater, weights
@@ -5,10 +5,9 @@
 if __name__ == "__main__":
     # Import standard modules ...
     import argparse
-    import glob
     import json
+    import multiprocessing
     import os
-    import string
 
     # Import special modules ...
     try:
@@ -38,10 +37,6 @@ if __name__ == "__main__":
         PIL.Image.MAX_IMAGE_PIXELS = 1024 * 1024 * 1024                         # [px]
     except:
         raise Exception("\"PIL\" is not installed; run \"pip install --user Pillow\"") from None
-    try:
-        import scipy
-    except:
-        raise Exception("\"scipy\" is not installed; run \"pip install --user scipy\"") from None
 
     # Import my modules ...
     try:
@@ -49,6 +44,7 @@ if __name__ == "__main__":
         import pyguymer3.image
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    import ssi
 
     # **************************************************************************
 
@@ -63,6 +59,34 @@ if __name__ == "__main__":
         action = "store_true",
           help = "print debug messages",
     )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           dest = "jobs",
+           help = "the number of worker processes to use",
+           type = int,
+    )
+    parser.add_argument(
+        "--latest",
+        action = "store_true",
+          help = "only process the last NetCDF file for each day (which is the only one that steps 3 and 4 use)",
+    )
+    parser.add_argument(
+        "--profile",
+        choices = [
+            "archival",
+            "fast",
+        ],
+        default = "archival",
+           dest = "profile",
+           help = "the PNG encoding profile (\"archival\" tries every PNG filter at zlib level 9, \"fast\" only tries one PNG filter at zlib level 1)",
+           type = str,
+    )
+    parser.add_argument(
+        "--pyramid",
+        action = "store_true",
+          help = "also make a pyramid of reduced-resolution maps (at 1/2, 1/4 and 1/8 of the width and height, without any text), by averaging the concentrations of the water pixels in each block of pixels, in the same pass",
+    )
     args = parser.parse_args()
 
     # **************************************************************************
@@ -76,18 +100,49 @@ if __name__ == "__main__":
     charsArr = numpy.array(charsImg)
     del charsImg
 
+    # Render the lines of text which are on every map once ...
+    overlay = ssi.makeOverlay(
+        [
+            "Baltic Sea - Sea Ice Concentration",
+            "Credits: E.U. Copernicus Marine Service Information",
+            "",
+        ],
+        charsArr,
+        sp,
+    )
+
     # Load colour tables and create short-hand ...
     with open(f"{pyguymer3.__path__[0]}/data/json/colourTables.json", mode = "rt", encoding = "utf-8") as fObj:
         colourTables = json.load(fObj)
     turbo = numpy.array(colourTables["turbo"]).astype(numpy.uint8)
 
+    # Make colour lookup table ...
+    lut = ssi.makeLut(turbo)
+
+    # Load manifest ...
+    manifest = ssi.loadManifest()
+
     # **************************************************************************
 
-    # Make output directory ...
+    # Set reduction factors ...
+    factors = [2, 4, 8] if args.pyramid else []
+
+    # Make output directories ...
     if not os.path.exists("studyBalticConcentration"):
         os.mkdir("studyBalticConcentration")
     if not os.path.exists("studyBalticConcentration/maps"):
         os.mkdir("studyBalticConcentration/maps")
+    for factor in factors:
+        if not os.path.exists(f"studyBalticConcentration/maps{factor:d}x"):
+            os.mkdir(f"studyBalticConcentration/maps{factor:d}x")
+
+    print("Refreshing \"studyBalticConcentration/catalogue.json\" ...")
+
+    # Load the catalogue of the mirror, refresh it and save it ...
+    catalogue = ssi.loadCatalogue()
+    nDirs = ssi.refreshCatalogue(catalogue)
+    ssi.saveCatalogue(catalogue)
+    print(f" > Listed {nDirs:,d} month directories; the mirror has {len(catalogue['files']):,d} NetCDF files.")
 
     print("Loading \"studyBalticConcentration/lat.bin\" ...")
 
@@ -113,106 +168,121 @@ if __name__ == "__main__":
         dtype = numpy.int8,
     ).reshape(refLat.size, refLon.size)                                         # [%]
 
+    print("Loading \"studyBalticConcentration/water.bin\" ...")
+
+    # Load the flat indices of the water pixels ...
+    iWater, _ = ssi.loadWater()
+
+    # Render the land and the out-of-scope water once ...
+    base = ssi.renderBase(refLvl, lut)
+
+    # Make the levels of the pyramid (rendering the land and the out-of-scope
+    # water of each of them) once ...
+    pyramid = {}
+    for factor in factors:
+        pyramid[factor] = ssi.makePyramidLevel(refLvl, lut, factor)
+
     # **************************************************************************
 
-    # Loop over NetCDF files ...
-    for nName in sorted(glob.glob("Copernicus/SEAICE_BAL_SEAICE_L4_NRT_OBSERVATIONS_011_004/FMI-BAL-SEAICE_CONC-L4-NRT-OBS/????/??/ice_conc_baltic_????????????.nc")):
-        # Deduce image name and skip if it already exists ...
-        stub = nName.split("_")[-1].removesuffix(".nc")
-        pName = f"studyBalticConcentration/maps/{stub[0:4]}-{stub[4:6]}-{stub[6:8]}_{stub[8:10]}-{stub[10:12]}.png"
-        if os.path.exists(pName):
-            continue
-
-        print(f"Making \"{pName}\" ...")
-
-        # Skip if there are errors ...
-        try:
-            # Open NetCDF file ...
-            with scipy.io.netcdf_file(nName, mode = "r") as fObj:
-                # Extract the first time from the dataset ...
-                lvl = numpy.array(fObj.variables["ice_concentration"][0, :, :]).astype(numpy.int8)  # [%]
-        except ValueError:
-            print(" > Skipping, error loading NetCDF.")
-            continue
-
-        # Demonstrate how the data is arranged ...
-        assert len(lvl.shape) == 2
-        assert lvl.shape == (refLat.size, refLon.size)
-
-        # Skip if there isn't any sea ice ...
-        if lvl.max() <= 0:
-            print(" > Skipping, no sea ice.")
-            continue
-
-        # Scale data from 0 to 255, mapping it from 0 % to 100 % ...
-        lvl = 255.0 * (lvl.astype(numpy.float32) / 100.0)
-        numpy.place(lvl, lvl <   0.0,   0.0)
-        numpy.place(lvl, lvl > 255.0, 255.0)
-        lvl = lvl.astype(numpy.uint8)
-
-        # Make image ...
-        # NOTE: If I just wanted to make an image of the Baltic sea ice then I
-        #       could skip this step and just make a paletted image. However, as
-        #       I also want to use the colour white (for land), the colour grey
-        #       (for out-of-scope water) and the colour black (for overlaid
-        #       text) then there would be more than 256 colours in the palette.
-        #       Therefore, it must be an RGB image.
-        img = numpy.zeros(
-            (refLat.size, refLon.size, 3),
-            dtype = numpy.uint8,
-        )
-        for iLat in range(refLat.size):
-            for iLon in range(refLon.size):
-                match refLvl[iLat, iLon]:
-                    case 0:                                                     # water
-                        img[iLat, iLon, :] = turbo[lvl[iLat, iLon], :]          # water
-                    case -99:                                                   # land
-                        img[iLat, iLon, :] = 255                                # land
-                    case -59:                                                   # out-of-scope water
-                        img[iLat, iLon, :] = 191                                # out-of-scope water
-                    case _:
-                        raise ValueError(f"{refLvl[iLat, iLon]:d} is not an expected value") from None
-        del lvl
-
-        # Declare overlays ...
-        overlays = [
-            "Baltic Sea - Sea Ice Concentration",
-            "Credits: E.U. Copernicus Marine Service Information",
-            "",
-            f"{stub[0:4]}-{stub[4:6]}-{stub[6:8]} {stub[8:10]}:{stub[10:12]}",
-        ]
-
-        # Loop over overlays ...
-        for i, overlay in enumerate(overlays):
-            # Loop over characters in overlay ...
-            for j, char in enumerate(overlay):
-                # Find the location of this character in the alphabet ...
-                idx = string.printable.index(char)
-
-                # Overlay this character ...
-                iy = 1 + i * charsArr.shape[0]                                  # [px]
-                ix = 1 + j * sp                                                 # [px]
-                img[iy:iy + charsArr.shape[0], ix:ix + sp, :] = charsArr[:, idx * sp:(idx + 1) * sp, :]
-
-        # Make PNG ...
-        src = pyguymer3.image.makePng(
-            img,
-            calcAdaptive = True,
-             calcAverage = True,
-                calcNone = True,
-               calcPaeth = True,
-                 calcSub = True,
-                  calcUp = True,
-                 choices = "all",
-                   debug = args.debug,
-                     dpi = None,
-                  levels = [9,],
-               memLevels = [9,],
-                 modTime = None,
-                palUint8 = None,
-              strategies = None,
-                  wbitss = [15,],
-        )
-        with open(pName, mode = "wb") as fObj:
-            fObj.write(src)
-        del img
+    # Create pool of workers and share the reference arrays with them ...
+    with multiprocessing.Pool(
+          processes = args.jobs,
+        initializer = ssi.initialiseWorker,
+           initargs = (
+            {
+                    "base" : base,
+                "charsArr" : charsArr,
+                   "debug" : args.debug,
+                  "iWater" : iWater,
+                     "lut" : lut,
+                 "overlay" : overlay,
+                 "profile" : args.profile,
+                 "pyramid" : pyramid,
+                      "sp" : sp,
+            },
+        ),
+    ) as pool:
+        # Initialize list ...
+        results = []
+
+        # Loop over NetCDF files ...
+        for stamp, nName in ssi.planNetCDFs(catalogue["files"], latest = args.latest):
+            # Deduce image names (the map and each level of the pyramid) ...
+            pNames = {1 : f"studyBalticConcentration/maps/{stamp}.png"}
+            for factor in factors:
+                pNames[factor] = f"studyBalticConcentration/maps{factor:d}x/{stamp}.png"
+
+            # Skip this NetCDF file if it is already known to be corrupt or to
+            # not have any sea ice ...
+            if ssi.fileStatus(catalogue, nName) in ["corrupt", "no ice"]:
+                # Remove any stale images (which were made from a previous
+                # version of the NetCDF file) ...
+                for pName in pNames.values():
+                    if os.path.exists(pName):
+                        print(f"Removing stale \"{pName}\" ...")
+                        os.remove(pName)
+                    manifest.pop(pName, None)
+                continue
+
+            # Deduce the inputs of each image and skip the ones which are
+            # up-to-date ...
+            todo = {}
+            for factor, pName in pNames.items():
+                iNames, version = ssi.dependencies("map" if factor == 1 else "pyramid", nName, profile = args.profile)
+                if ssi.needsMaking(manifest, pName, iNames, version, catalogue = catalogue):
+                    todo[factor] = (pName, iNames, version)
+
+            # Skip this NetCDF file if all of the images are up-to-date ...
+            if len(todo) == 0:
+                continue
+
+            # Add job to pool ...
+            results.append(
+                (
+                    nName,
+                    todo,
+                    pool.apply_async(
+                        ssi.makeMap,
+                        (nName, {factor : pName for factor, (pName, _, _) in todo.items()}),
+                    ),
+                )
+            )
+
+        # Loop over results (in the same order that they were added) ...
+        for i, (nName, todo, result) in enumerate(results):
+            for pName, _, _ in todo.values():
+                print(f"Making \"{pName}\" ...")
+
+            # Wait for the job to finish, record the status of the NetCDF file
+            # and check if it was skipped ...
+            status, msg = result.get()
+            print(msg)
+            ssi.recordStatus(catalogue, nName, status)
+            for pName, iNames, version in todo.values():
+                if status == "ok":
+                    # Record the image in the manifest ...
+                    ssi.recordArtefact(manifest, pName, iNames, version)
+                else:
+                    # Remove any stale image (which was made from a previous
+                    # version of the NetCDF file) ...
+                    if os.path.exists(pName):
+                        print(f" > Removing stale \"{pName}\".")
+                        os.remove(pName)
+                    manifest.pop(pName, None)
+
+            # Save the manifest and the catalogue every so often (so that not
+            # much is lost if this script is interrupted) ...
+            if (i + 1) % 100 == 0:
+                ssi.saveManifest(manifest)
+                ssi.saveCatalogue(catalogue)
+
+        # Close the pool of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of "multiprocessing.Pool" calls
+        #       "terminate()" instead of "join()".
+        pool.close()
+        pool.join()
+
+    # Save manifest and catalogue ...
+    ssi.saveManifest(manifest)
+    ssi.saveCatalogue(catalogue)
@@ -4,9 +4,10 @@
 # NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
 if __name__ == "__main__":
     # Import standard modules ...
+    import argparse
     import datetime
     import glob
-    import json
+    import multiprocessing
     import os
 
     # Import special modules ...
@@ -31,10 +32,6 @@ if __name__ == "__main__":
         import numpy
     except:
         raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
-    try:
-        import scipy
-    except:
-        raise Exception("\"scipy\" is not installed; run \"pip install --user scipy\"") from None
 
     # Import my modules ...
     try:
@@ -42,15 +39,51 @@ if __name__ == "__main__":
         import pyguymer3.image
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    import ssi
 
     # **************************************************************************
 
-    # Make output directory ...
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Make histograms of Baltic sea ice.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--csv",
+        action = "store_true",
+          help = "also export each histogram to a CSV file in \"studyBalticConcentration/histograms\"",
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           dest = "jobs",
+           help = "the number of worker processes to use",
+           type = int,
+    )
+    parser.add_argument(
+        "--latest",
+        action = "store_true",
+          help = "only process the last NetCDF file for each day (which is the only one that steps 3 and 4 use)",
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Make output directories ...
     if not os.path.exists("studyBalticConcentration"):
         os.mkdir("studyBalticConcentration")
-    if not os.path.exists("studyBalticConcentration/histograms"):
+    if args.csv and not os.path.exists("studyBalticConcentration/histograms"):
         os.mkdir("studyBalticConcentration/histograms")
 
+    print("Refreshing \"studyBalticConcentration/catalogue.json\" ...")
+
+    # Load the catalogue of the mirror, refresh it and save it ...
+    catalogue = ssi.loadCatalogue()
+    nDirs = ssi.refreshCatalogue(catalogue)
+    ssi.saveCatalogue(catalogue)
+    print(f" > Listed {nDirs:,d} month directories; the mirror has {len(catalogue['files']):,d} NetCDF files.")
+
     print("Loading \"studyBalticConcentration/lat.bin\" ...")
 
     # Load BIN file ...
@@ -67,106 +100,166 @@ if __name__ == "__main__":
         dtype = numpy.float32,
     )                                                                           # [°]
 
-    print("Loading \"studyBalticConcentration/conc.bin\" ...")
+    print("Loading \"studyBalticConcentration/water.bin\" and \"studyBalticConcentration/weights.bin\" ...")
 
-    # Load BIN file ...
-    refLvl = numpy.fromfile(
-        "studyBalticConcentration/conc.bin",
-        dtype = numpy.int8,
-    ).reshape(refLat.size, refLon.size)                                         # [%]
+    # Load the flat indices of the water pixels and the area of each of them ...
+    iWater, weights = ssi.loadWater()                                           # [km2]
 
-    print("Loading \"studyBalticConcentration/areaCoef.json\" ...")
+    # Load manifest ...
+    manifest = ssi.loadManifest()
 
-    # Load area coefficients ...
-    with open("studyBalticConcentration/areaCoef.json", mode = "rt", encoding = "utf-8") as fObj:
-        coef = json.load(fObj)                                                  # [km2], [km2/°], [km2/°2]
+    print("Loading \"studyBalticConcentration/histograms.csv\" ...")
 
-    # Calculate the area as a function of latitude ...
-    lat2area = numpy.zeros(
-        refLat.size,
-        dtype = numpy.float64,
-    )                                                                           # [km2]
-    for iLat in range(refLat.size):
-        lat2area[iLat] = coef[0] + coef[1] * refLat[iLat] + coef[2] * refLat[iLat] * refLat[iLat]   # [km2]
+    # Load the time index of the store of histograms and find which histograms
+    # are in it (as a set, for fast look-ups) ...
+    index = ssi.loadHistogramIndex()
+    stamps, _ = ssi.loadHistograms()
+    stamps = set(stamps)
+
+    # Initialize set ...
+    made = set()
+
+    # **************************************************************************
+
+    # Create pool of workers and share the reference arrays with them ...
+    with multiprocessing.Pool(
+          processes = args.jobs,
+        initializer = ssi.initialiseWorker,
+           initargs = (
+            {
+                 "iWater" : iWater,
+                  "shape" : (refLat.size, refLon.size),
+                "weights" : weights,
+            },
+        ),
+    ) as pool:
+        # Initialize list ...
+        results = []
+
+        # Loop over NetCDF files ...
+        for stamp, nName in ssi.planNetCDFs(catalogue["files"], latest = args.latest):
+            # Deduce histogram name and sparse name ...
+            hName = f"studyBalticConcentration/histograms.bin:{stamp}"
+            sName = f"studyBalticConcentration/sparse/{stamp}.bin"
+
+            # Skip this NetCDF file if it is already known to be corrupt or to
+            # not have any sea ice ...
+            if ssi.fileStatus(catalogue, nName) in ["corrupt", "no ice"]:
+                # Remove any stale histogram (which was made from a previous
+                # version of the NetCDF file) ...
+                if stamp in stamps:
+                    print(f"Removing stale \"{hName}\" ...")
+                    ssi.saveHistogram(None, stamp, index)
+                manifest.pop(hName, None)
+                continue
+
+            # Deduce histogram inputs and skip if it is up-to-date ...
+            iNames, version = ssi.dependencies("histogram", nName)
+            if not ssi.needsMaking(manifest, hName, iNames, version, catalogue = catalogue, exists = stamp in stamps):
+                continue
+
+            # Check if the sparse file is up-to-date (so that it can be loaded
+            # instead of the NetCDF file) ...
+            # NOTE: The sparse files are made by "step012_processData.py".
+            useSparse = not ssi.needsMaking(manifest, sName, *ssi.dependencies("sparse", nName), adopt = False, catalogue = catalogue)
+
+            # Add job to pool ...
+            results.append(
+                (
+                    nName,
+                    stamp,
+                    hName,
+                    iNames,
+                    version,
+                    pool.apply_async(
+                        ssi.makeHistogram,
+                        (nName, sName if useSparse else None),
+                    ),
+                )
+            )
+
+        # Loop over results (in the same order that they were added) ...
+        for i, (nName, stamp, hName, iNames, version, result) in enumerate(results):
+            print(f"Making \"{hName}\" ...")
+
+            # Wait for the job to finish, record the status of the NetCDF file
+            # and check if it was skipped ...
+            status, hist, msg = result.get()                                    # [km2]
+            ssi.recordStatus(catalogue, nName, status)
+            if status == "ok":
+                # Save the histogram to the store and record it in the
+                # manifest ...
+                ssi.saveHistogram(hist, stamp, index)
+                ssi.recordArtefact(manifest, hName, iNames, version)
+                made.add(stamp)
+            else:
+                print(msg)
+
+                # Remove any stale histogram (which was made from a previous
+                # version of the NetCDF file) ...
+                if stamp in stamps:
+                    print(f" > Removing stale \"{hName}\".")
+                    ssi.saveHistogram(None, stamp, index)
+                manifest.pop(hName, None)
+
+            # Save the manifest and the catalogue every so often (so that not
+            # much is lost if this script is interrupted) ...
+            if (i + 1) % 100 == 0:
+                ssi.saveManifest(manifest)
+                ssi.saveCatalogue(catalogue)
+
+        # Close the pool of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of "multiprocessing.Pool" calls
+        #       "terminate()" instead of "join()".
+        pool.close()
+        pool.join()
+
+    # Save manifest and catalogue ...
+    ssi.saveManifest(manifest)
+    ssi.saveCatalogue(catalogue)
 
     # **************************************************************************
 
-    # Loop over NetCDF files ...
-    for nName in sorted(glob.glob("Copernicus/SEAICE_BAL_SEAICE_L4_NRT_OBSERVATIONS_011_004/FMI-BAL-SEAICE_CONC-L4-NRT-OBS/????/??/ice_conc_baltic_????????????.nc")):
-        # Deduce histogram name and skip if it already exists ...
-        stub = nName.split("_")[-1].removesuffix(".nc")
-        cName = f"studyBalticConcentration/histograms/{stub[0:4]}-{stub[4:6]}-{stub[6:8]}_{stub[8:10]}-{stub[10:12]}.csv"
-        if os.path.exists(cName):
-            continue
-
-        print(f"Making \"{cName}\" ...")
-
-        # Skip if there are errors ...
-        try:
-            # Open NetCDF file ...
-            with scipy.io.netcdf_file(nName, mode = "r") as fObj:
-                # Extract the first time from the dataset ...
-                lvl = numpy.array(fObj.variables["ice_concentration"][0, :, :]).astype(numpy.int8)  # [%]
-        except ValueError:
-            print(" > Skipping, error loading NetCDF.")
-            continue
-
-        # Demonstrate how the data is arranged ...
-        assert len(lvl.shape) == 2
-        assert lvl.shape == (refLat.size, refLon.size)
-
-        # Skip if there isn't any sea ice ...
-        if lvl.max() <= 0:
-            print(" > Skipping, no sea ice.")
-            continue
-
-        # Open CSV file ...
-        with open(cName, mode = "wt", encoding = "utf-8") as fObj:
-            # Write header ...
-            fObj.write("sea ice concentration [%],area [km²]\n")
-
-            # Loop over concentrations ...
-            for conc in range(101):
-                # Calculate the total area which has this concentration ...
-                totArea = 0.0                                                   # [km2]
-                for iLat in range(refLat.size):
-                    for iLon in range(refLon.size):
-                        match refLvl[iLat, iLon]:
-                            case 0:                                             # water
-                                if lvl[iLat, iLon] == conc:                     # water
-                                    totArea += lat2area[iLat]                   # water
-                            case -99:                                           # land
-                                pass                                            # land
-                            case -59:                                           # out-of-scope water
-                                pass                                            # out-of-scope water
-                            case _:
-                                raise ValueError(f"{refLvl[iLat, iLon]:d} is not an expected value") from None
+    print("Loading \"studyBalticConcentration/histograms.bin\" ...")
 
-                # Write data ...
-                fObj.write(f"{conc:d},{totArea:.15e}\n")
+    # Load the store of histograms ...
+    stamps, hists = ssi.loadHistograms()                                        # [km2]
+
+    # Define the concentrations ...
+    x = numpy.arange(101, dtype = numpy.float64)                                # [%]
+
+    # **************************************************************************
+
+    # Check if the user wants CSV files ...
+    if args.csv:
+        print("Exporting CSV files ...")
+
+        # Loop over histograms ...
+        for stamp, hist in zip(stamps, hists, strict = True):
+            # Export the histogram (if it is new or it has changed) ...
+            cName = f"studyBalticConcentration/histograms/{stamp}.csv"
+            if stamp in made or not os.path.exists(cName):
+                ssi.writeHistogram(hist, cName)
+
+        # Convert list to set (for fast look-ups) ...
+        live = set(stamps)
+
+        # Loop over CSV files ...
+        for cName in sorted(glob.glob("studyBalticConcentration/histograms/????-??-??_??-??.csv")):
+            # Remove any stale CSV file (which was exported from a histogram
+            # which no longer exists) ...
+            if os.path.basename(cName).removesuffix(".csv") not in live:
+                print(f"Removing stale \"{cName}\" ...")
+                os.remove(cName)
 
     # **************************************************************************
 
     print("Summarising ...")
 
-    # Initialize maxima ...
-    max1 = 0.0                                                                  # [km2]
-    max2 = 0.0                                                                  # [km2]
-
-    # Loop over histograms ...
-    for cName in sorted(glob.glob("studyBalticConcentration/histograms/????-??-??_??-??.csv")):
-        # Load histogram ...
-        x, y = numpy.loadtxt(
-            cName,
-            delimiter = ",",
-                dtype = numpy.float64,
-             skiprows = 1,
-               unpack = True,
-        )                                                                       # [%], [km2]
-
-        # Update maxima ...
-        max1 = max(max1, y[1:101].max())                                        # [km2]
-        max2 = max(max2, 0.01 * numpy.dot(x[1:101], y[1:101]))                  # [km2]
+    # Find maxima ...
+    max1 = hists[:, 1:101].max(initial = 0.0)                                   # [km2]
+    max2 = (0.01 * numpy.dot(hists[:, 1:101], x[1:101])).max(initial = 0.0)     # [km2]
 
     # Print summary ...
     print(f"The highest single non-zero occurrence is {max1:,.1f} km².")
@@ -176,11 +269,52 @@ if __name__ == "__main__":
 
     print("Saving trends ...")
 
-    # Define the start of the dataset ...
-    stub = datetime.date(2018, 1, 1)
+    # Define all dates since the start of the dataset ...
+    dates = numpy.arange(
+        numpy.datetime64("2018-01-01"),
+        numpy.datetime64(datetime.date.today()) + 1,
+    )
 
-    # Initialize totals ...
-    tots = {}
+    # Find the day of each histogram (relative to the start of the dataset) and
+    # find the most up-to-date histogram for each day ...
+    # NOTE: The histograms are in chronological order, therefore the last one
+    #       for each day wins.
+    iDays = (numpy.array([stamp[:10] for stamp in stamps], dtype = "datetime64[D]") - dates[0]).astype(numpy.int64)
+    latest = numpy.append(iDays[1:] != iDays[:-1], True) & (iDays >= 0) & (iDays < dates.size)
+
+    # Make a date-indexed array of the most up-to-date histogram for each day
+    # (leaving the days without a histogram empty) ...
+    found = numpy.zeros(
+        dates.size,
+        dtype = bool,
+    )
+    daily = numpy.zeros(
+        (dates.size, 101),
+        dtype = numpy.float64,
+    )                                                                           # [km2]
+    found[iDays[latest]] = True
+    daily[iDays[latest], :] = hists[latest, :]                                  # [km2]
+
+    # Calculate the total area and the 100%-concentration equivalent area for
+    # each day ...
+    totals = daily[:, 1:101].sum(axis = 1)                                      # [km2]
+    equivs = 0.01 * numpy.dot(daily[:, 1:101], x[1:101])                        # [km2]
+
+    # Deduce the year, month and day of each date ...
+    years = dates.astype("datetime64[Y]").astype(numpy.int64) + 1970
+    months = dates.astype("datetime64[M]").astype(numpy.int64) % 12 + 1
+    days = (dates - dates.astype("datetime64[M]")).astype(numpy.int64) + 1
+
+    # Deduce the key for the totals (i.e., the winter) of each date ...
+    # NOTE: If the date is after the summer solstice then it is part of next
+    #       year's winter.
+    keys = years + ((months > 6) | ((months == 6) & (days >= 21))).astype(numpy.int64)
+
+    # Sum the 100%-concentration equivalent area over each winter ...
+    tots = numpy.bincount(
+        keys - keys[0],
+        weights = equivs,
+    )                                                                           # [km2.day]
 
     # Open CSV file ...
     with open("studyBalticConcentration/trends.csv", mode = "wt", encoding = "utf-8") as fObj:
@@ -188,65 +322,25 @@ if __name__ == "__main__":
         fObj.write("date,total sea ice area [km²],100%-concentration equivalent sea ice area [km²]\n")
 
         # Loop over all dates since the start of the dataset ...
-        while stub <= datetime.date.today():
-            # Deduce key for the totals ...
-            # NOTE: If the date is after the summer solstice then it is part of
-            #       next year's winter.
-            if stub < datetime.date(stub.year, 6, 21):
-                key = stub.year
-            else:
-                key = stub.year + 1
-
-            # Initialize the total for the year ...
-            if key not in tots:
-                tots[key] = 0.0                                                 # [km2.day]
-
-            # Find histograms ...
-            cNames = sorted(glob.glob(f"studyBalticConcentration/histograms/{stub.isoformat()}_??-??.csv"))
-
+        for date, isFound, total, equiv in zip(dates.astype(str), found, totals, equivs, strict = True):
             # Check what to do ...
-            if len(cNames) == 0:
+            if not isFound:
                 # Write data ...
-                fObj.write(f"{stub.isoformat()},{0:d},{0.0:e}\n")
+                fObj.write(f"{date},{0:d},{0.0:e}\n")
             else:
-                # Load most up-to-date histogram for the day ...
-                x, y = numpy.loadtxt(
-                    cNames[-1],
-                    delimiter = ",",
-                        dtype = numpy.float64,
-                     skiprows = 1,
-                       unpack = True,
-                )                                                               # [%], [km2]
-
-                # Increment total ...
-                tots[key] += 0.01 * numpy.dot(x[1:101], y[1:101])               # [km2.day]
-
                 # Write data ...
-                fObj.write(f"{stub.isoformat()},{y[1:101].sum():.15e},{0.01 * numpy.dot(x[1:101], y[1:101]):.15e}\n")
-
-            # Increment date stub ...
-            stub = stub + datetime.timedelta(days = 1)
+                fObj.write(f"{date},{total:.15e},{equiv:.15e}\n")
 
-    # Initialize lists ...
-    x = []
-    y = []                                                                      # [km2.day]
+    # Find the years which are not empty ...
+    x = numpy.arange(keys[0], keys[0] + tots.size)
+    y = tots                                                                    # [km2.day]
+    x = x[y > 0.0]
+    y = y[y > 0.0]                                                              # [km2.day]
 
     # Loop over years ...
-    for year in sorted(tots.keys()):
-        # Skip empty years ...
-        if tots[year] <= 0.0:
-            continue
-
-        # Append values to lists ...
-        x.append(year)
-        y.append(tots[year])                                                    # [km2.day]
-
+    for year, tot in zip(x, y, strict = True):
         # Print total ...
-        print(f"{year:d} = {tots[year]:,.1f} km².day")
-
-    # Convert lists to arrays ...
-    x = numpy.array(x)
-    y = numpy.array(y)                                                          # [km2.day]
+        print(f"{year:d} = {tot:,.1f} km².day")
 
     # **************************************************************************
 
@@ -4,7 +4,11 @@
 # NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
 if __name__ == "__main__":
     # Import standard modules ...
+    import argparse
     import glob
+    import hashlib
+    import math
+    import multiprocessing
     import os
 
     # Import special modules ...
@@ -22,20 +26,28 @@ if __name__ == "__main__":
                      "image.resample" : False,
             }
         )
-        import matplotlib.pyplot
     except:
         raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
-    try:
-        import numpy
-    except:
-        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
 
     # Import my modules ...
-    try:
-        import pyguymer3
-        import pyguymer3.image
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    import ssi
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Make plots of Baltic sea ice.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           dest = "jobs",
+           help = "the number of worker processes to use (each of which makes its own template and then makes a contiguous block of plots)",
+           type = int,
+    )
+    args = parser.parse_args()
 
     # **************************************************************************
 
@@ -68,96 +80,133 @@ if __name__ == "__main__":
 
     # **************************************************************************
 
+    print("Loading \"studyBalticConcentration/histograms.bin\" ...")
+
+    # Load the store of histograms and find the most up-to-date histogram for
+    # each day ...
+    # NOTE: The histograms are in chronological order, therefore the last one
+    #       for each day wins.
+    stamps, hists = ssi.loadHistograms()                                        # [km2]
+    latest = {}
+    for stamp, hist in zip(stamps, hists, strict = True):
+        latest[stamp[:10]] = hist                                               # [km2]
+
+    # **************************************************************************
+
+    # Find the most up-to-date map for each day ...
+    # NOTE: The maps are in chronological order, therefore the last one for
+    #       each day wins.
+    latestMaps = {}
+    for mName in sorted(glob.glob("studyBalticConcentration/maps/????-??-??_??-??.png")):
+        latestMaps[os.path.basename(mName)[:10]] = mName
+
+    # Load manifest ...
+    # NOTE: The plots are not remade just because "trends.csv" has changed
+    #       (which it does every day), otherwise every plot would be remade
+    #       every day.
+    manifest = ssi.loadManifest()
+
+    # Find the version of the code which makes the plots ...
+    # NOTE: This is only found once, as it is the same for every plot (only the
+    #       histogram changes from plot to plot).
+    codeVer = ssi.codeVersion(__file__, ssi.drawPlot, ssi.makePlotTemplate, ssi.makePlots)
+
+    # Initialize list ...
+    todo = []
+
     # Loop over dates ...
     for date, total, equiv in zip(dates, totals, equivs, strict = True):
-        # Deduce plot name and skip if it already exists ...
+        # Deduce plot name ...
         pName = f"studyBalticConcentration/plots/{date}.png"
-        if os.path.exists(pName):
-            continue
-
-        print(f"Making \"{pName}\" ...")
-
-        # Find histograms and maps ...
-        cNames = sorted(glob.glob(f"studyBalticConcentration/histograms/{date}_??-??.csv"))
-        pNames = sorted(glob.glob(f"studyBalticConcentration/maps/{date}_??-??.png"))
 
         # Skip this date if there isn't both a histogram and a map ...
-        if len(cNames) == 0 or len(pNames) == 0:
-            print(" > Skipping, no histogram/map.")
+        if date not in latest or date not in latestMaps:
+            # Remove any stale plot (which was made from a histogram/map which
+            # no longer exists) ...
+            if os.path.exists(pName):
+                print(f"Removing stale \"{pName}\" ...")
+                os.remove(pName)
+            manifest.pop(pName, None)
             continue
 
-        # Load most up-to-date histogram for the day ...
-        x, y = numpy.loadtxt(
-            cNames[-1],
-            delimiter = ",",
-                dtype = numpy.float64,
-             skiprows = 1,
-               unpack = True,
-        )                                                                       # [%], [km2]
-
-        # Convert to useful units ...
-        y *= 0.001                                                              # [10^3 km2]
-
-        # Create figure ...
-        fg = matplotlib.pyplot.figure(figsize = (4.1, 4.9))
-
-        # Create axes ...
-        ax = fg.subplots(2, 1)
-
-        # Plot data ...
-        ax[0].bar(
-            dates,
-            equivs,
-            width = 1,
-        )
-        ax[0].bar(
-            [date],
-            [equiv],
-            width = 10,
-        )
-        ax[1].bar(
-            x,
-            y,
-            width = 1,
-        )
+        # Skip if the plot is up-to-date ...
+        # NOTE: The histogram is not a file, it is a row in the store of
+        #       histograms, therefore it is hashed together with the version of
+        #       the code to make the version of the plot (rather than being one
+        #       of its inputs).
+        iNames = [
+            latestMaps[date],
+        ]
+        hObj = hashlib.sha256(codeVer.encode("ascii"))
+        hObj.update(latest[date].tobytes())
+        version = hObj.hexdigest()
+        if not ssi.needsMaking(manifest, pName, iNames, version):
+            continue
 
-        # Configure axis ...
-        ax[0].grid()
-        ax[0].set_xlim(dates[0], dates[-1])
-        ax[0].set_xticks(
-            labels_loc,
-              labels = labels_txt,
-                  ha = "right",
-            rotation = 45,
-        )
-        ax[0].set_ylabel("100%-Concentration Equivalent\nSea Ice Area [10³ km²]")
-        ax[0].set_ylim(0.0, 170.0)
-
-        # Configure axis ...
-        ax[1].grid()
-        ax[1].set_xlabel("Concentration [%]")
-        ax[1].set_xlim(-0.5, 100.5)
-        ax[1].set_ylabel("Sea Ice Area [10³ km²]")
-        ax[1].set_ylim(0, 85)
-
-        # Shade alternate years ...
-        for yyyy in range(int(dates[0].split("-")[0]), int(dates[-1].split("-")[0]) + 1, 2):
-            ax[0].axvspan(
-                f"{yyyy}-01-01",
-                f"{yyyy}-12-31",
-                    alpha = 0.25,
-                facecolor = "grey",
+        # Add the plot to the list, using the most up-to-date histogram for the
+        # day (in useful units) ...
+        todo.append((date, equiv, 0.001 * latest[date], pName, iNames, version))
+
+    # Find the number of plots in each block (so that each worker process
+    # makes roughly the same number of blocks and so that the manifest is saved
+    # at least every 100 plots) ...
+    # NOTE: Each worker process makes its own template, which takes as long to
+    #       make as a few plots, therefore the blocks are contiguous and as
+    #       large as possible.
+    nBlock = max(1, min(100, math.ceil(len(todo) / args.jobs)))
+
+    # Create pool of workers and share the trends with them ...
+    # NOTE: The worker processes configure matplotlib themselves, using the
+    #       same configuration as this process.
+    with multiprocessing.Pool(
+          processes = args.jobs,
+        initializer = ssi.initialiseWorker,
+           initargs = (
+            {
+                    "dates" : dates,
+                   "equivs" : equivs,
+                "labelsLoc" : labels_loc,
+                "labelsTxt" : labels_txt,
+                 "rcParams" : dict(matplotlib.rcParams),
+            },
+        ),
+    ) as pool:
+        # Initialize list ...
+        results = []
+
+        # Loop over blocks ...
+        for i in range(0, len(todo), nBlock):
+            # Add job to pool ...
+            results.append(
+                (
+                    [(pName, iNames, version) for _, _, _, pName, iNames, version in todo[i:i + nBlock]],
+                    pool.apply_async(
+                        ssi.makePlots,
+                        ([(date, equiv, hist, pName) for date, equiv, hist, pName, _, _ in todo[i:i + nBlock]],),
+                    ),
+                )
             )
 
-        # Configure figure ...
-        fg.tight_layout()
-
-        # Save figure ...
-        fg.savefig(pName)
-        matplotlib.pyplot.close(fg)
-
-        # Optimize PNG ...
-        pyguymer3.image.optimise_image(
-            pName,
-            strip = True,
-        )
+        # Loop over results (in the same order that they were added) ...
+        for plots, result in results:
+            for pName, iNames, version in plots:
+                print(f"Making \"{pName}\" ...")
+
+            # Wait for the job to finish and record the plots in the manifest ...
+            result.get()
+            for pName, iNames, version in plots:
+                ssi.recordArtefact(manifest, pName, iNames, version)
+
+            # Save the manifest (so that not much is lost if this script is
+            # interrupted) ...
+            ssi.saveManifest(manifest)
+
+        # Close the pool of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of "multiprocessing.Pool" calls
+        #       "terminate()" instead of "join()".
+        pool.close()
+        pool.join()
+
+    # Save manifest ...
+    ssi.saveManifest(manifest)
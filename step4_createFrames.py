@@ -4,25 +4,46 @@
 # NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
 if __name__ == "__main__":
     # Import standard modules ...
+    import argparse
     import glob
+    import multiprocessing
     import os
     import shutil
 
-    # Import special modules ...
-    try:
-        import PIL
-        import PIL.Image
-        PIL.Image.MAX_IMAGE_PIXELS = 1024 * 1024 * 1024                         # [px]
-    except:
-        raise Exception("\"PIL\" is not installed; run \"pip install --user Pillow\"") from None
-
     # Import my modules ...
     try:
         import pyguymer3
-        import pyguymer3.image
         import pyguymer3.media
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    import ssi
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Make frames and videos of Baltic sea ice.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           dest = "jobs",
+           help = "the number of worker processes to use",
+           type = int,
+    )
+    parser.add_argument(
+        "--stream",
+        action = "store_true",
+          help = "make all of the MP4s with a single \"ffmpeg\" process, by decoding each PNG frame only once and piping its raw RGB pixels into it (rather than running \"ffmpeg\" once per MP4, which decodes every PNG frame once per MP4)",
+    )
+    args = parser.parse_args()
 
     # **************************************************************************
 
@@ -34,88 +55,198 @@ if __name__ == "__main__":
 
     # **************************************************************************
 
-    # Loop over plots ...
-    for pName in sorted(glob.glob("studyBalticConcentration/plots/????-??-??.png")):
-        # Extract date ...
-        date = os.path.basename(pName).removesuffix(".png")
+    # Find the most up-to-date map for each day ...
+    # NOTE: The maps are in chronological order, therefore the last one for
+    #       each day wins.
+    latestMaps = {}
+    for mName in sorted(glob.glob("studyBalticConcentration/maps/????-??-??_??-??.png")):
+        latestMaps[os.path.basename(mName)[:10]] = mName
+
+    # Load manifest and find the version of the code which makes the frames ...
+    manifest = ssi.loadManifest()
+    version = ssi.codeVersion(__file__, ssi.makeFrame)
+
+    # Loop over temporary frames ...
+    for tName in sorted(glob.glob("studyBalticConcentration/frames/????-??-??.tmp.png")):
+        # Remove the temporary frame (which was left behind by a previous run
+        # which was interrupted) ...
+        print(f"Removing stale \"{tName}\" ...")
+        os.remove(tName)
+
+    # Initialize list ...
+    expected = []
+
+    # Create pool of workers ...
+    with multiprocessing.Pool(processes = args.jobs) as pool:
+        # Initialize list ...
+        results = []
+
+        # Loop over plots ...
+        for pName in sorted(glob.glob("studyBalticConcentration/plots/????-??-??.png")):
+            # Extract date ...
+            date = os.path.basename(pName).removesuffix(".png")
+
+            # Deduce frame name ...
+            fName = f"studyBalticConcentration/frames/{date}.png"
+
+            # Skip this date if there isn't a map ...
+            if date not in latestMaps:
+                # Remove any stale frame (which was made from a map which no
+                # longer exists) ...
+                if os.path.exists(fName):
+                    print(f"Removing stale \"{fName}\" ...")
+                    os.remove(fName)
+                manifest.pop(fName, None)
+                continue
+            expected.append(fName)
+
+            # Skip if the frame is up-to-date ...
+            iNames = [
+                latestMaps[date],
+                pName,
+            ]
+            if not ssi.needsMaking(manifest, fName, iNames, version):
+                continue
+
+            # Add job to pool ...
+            results.append(
+                (
+                    fName,
+                    iNames,
+                    pool.apply_async(
+                        ssi.makeFrame,
+                        (latestMaps[date], pName, fName),
+                    ),
+                )
+            )
+
+        # Loop over results (in the same order that they were added) ...
+        for i, (fName, iNames, result) in enumerate(results):
+            print(f"Making \"{fName}\" ...")
+
+            # Wait for the job to finish and record the frame in the manifest ...
+            result.get()
+            ssi.recordArtefact(manifest, fName, iNames, version)
+
+            # Save the manifest every so often (so that not much is lost if this
+            # script is interrupted) ...
+            if (i + 1) % 100 == 0:
+                ssi.saveManifest(manifest)
+
+        # Close the pool of worker processes and wait for all of the tasks to
+        # finish ...
+        # NOTE: The "__exit__()" call of "multiprocessing.Pool" calls
+        #       "terminate()" instead of "join()".
+        pool.close()
+        pool.join()
+
+    # Save manifest ...
+    ssi.saveManifest(manifest)
 
-        # Deduce frame name and skip if it already exists ...
-        fName = f"studyBalticConcentration/frames/{date}.png"
-        if os.path.exists(fName):
-            continue
+    # **************************************************************************
 
-        print(f"Making \"{fName}\" ...")
+    # Find the frames ...
+    frames = sorted(glob.glob("studyBalticConcentration/frames/????-??-??.png"))
 
-        # Find maps ...
-        mNames = sorted(glob.glob(f"studyBalticConcentration/maps/{date}_??-??.png"))
+    # Check that every frame exists before making any MP4s ...
+    missing = sorted(set(expected) - set(frames))
+    if len(missing) > 0:
+        raise Exception(f"{len(missing):,d} frames are missing (e.g., \"{missing[0]}\"); the MP4s have not been made") from None
 
-        # Skip this date if there isn't a map ...
-        if len(mNames) == 0:
-            print(" > Skipping, no map.")
-            continue
+    # Find the digest of the frames ...
+    # NOTE: Every MP4 is made from every frame, therefore the frames are
+    #       summarised by their records in the manifest (which is part of the
+    #       version of each MP4) rather than each of them being an input of each
+    #       MP4, which would be stat-ed (and maybe hashed) for each MP4.
+    framesDigest = ssi.artefactsDigest(manifest, frames)
 
-        # Open image as RGB (even if it is paletted) ...
-        with PIL.Image.open(mNames[-1]) as iObj:
-            im1 = iObj.convert("RGB")
-
-        # Open image as RGB (even if it is paletted) ...
-        with PIL.Image.open(pName) as iObj:
-            im2 = iObj.convert("RGB")
-
-        # Calculate width (ensuring that it is even) ...
-        w = im1.width + im2.width + 30                                          # [px]
-        if w % 2 == 1:
-            w += 1                                                              # [px]
-
-        # Calculate height (ensuring that it is even) ...
-        h = max(im1.height, im2.height) + 20                                    # [px]
-        if h % 2 == 1:
-            h += 1                                                              # [px]
-
-        # Create empty frame ...
-        assert (w * h) <= PIL.Image.MAX_IMAGE_PIXELS, f"image size is larger than maximum number of pixels allowed in Pillow ({w:,d} px × {h:,d} px > {PIL.Image.MAX_IMAGE_PIXELS:,d} px)"
-        im0 = PIL.Image.new("RGB", (w, h), (242, 242, 242))
-
-        # Add the map and the plot ...
-        im0.paste(im1, (10, 10 + ((im0.height - 20) - im1.height) // 2))
-        im0.paste(im2, (20 + im1.width, 10 + ((im0.height - 20) - im2.height) // 2))
-
-        # Save frame ...
-        im0.save(fName)
-        pyguymer3.image.optimise_image(
-            fName,
-            strip = True,
-        )
+    # Set maximum sizes ...
+    # NOTE: By inspection, the PNG frames are 2,484 px wide.
+    maxSizes = [256, 512, 1024, 2048]                                           # [px]
+
+    # Find if the MP4s should be made with debug messages ...
+    # NOTE: "--debug" can only turn the debug messages on, so that otherwise
+    #       the MP4s are made with the default of
+    #       "pyguymer3.media.images2mp4()" (which is "__debug__"), as they
+    #       always were.
+    mp4Debug = args.debug or __debug__
 
     # **************************************************************************
 
-    # Find the frames ...
-    frames = sorted(glob.glob("studyBalticConcentration/frames/????-??-??.png"))
+    # Check if the user wants to make all of the MP4s at once ...
+    if args.stream:
+        # Find the version of the code which makes the MP4s ...
+        # NOTE: The MP4s are encoded differently, therefore they have a
+        #       different version.
+        mp4Version = ssi.codeVersion(__file__, ssi.encodeMp4s, frames = framesDigest)
+
+        # Find which MP4s need making ...
+        # NOTE: The MP4s were always made before the manifest existed,
+        #       therefore an existing MP4 which is not in the manifest is not
+        #       adopted.
+        vNames = {}
+        for vName, maxSize in [("studyBalticConcentration/trends.mp4", None)] + [(f"studyBalticConcentration/trends{maxSize:04d}px.mp4", maxSize) for maxSize in maxSizes]:
+            if ssi.needsMaking(manifest, vName, [], mp4Version, adopt = False):
+                vNames[vName] = maxSize
+
+        # Check if any MP4s need making ...
+        if len(vNames) > 0:
+            for vName in vNames:
+                print(f"Making \"{vName}\" ...")
+
+            # Save 25fps MP4s ...
+            ssi.encodeMp4s(
+                frames,
+                vNames,
+                debug = mp4Debug,
+            )
+
+            # Record the MP4s in the manifest and save the manifest ...
+            for vName in vNames:
+                ssi.recordArtefact(manifest, vName, [], mp4Version)
+            ssi.saveManifest(manifest)
 
     # **************************************************************************
 
-    print("Making \"studyBalticConcentration/trends.mp4\" ...")
+    # Find the version of the code which makes the MP4s ...
+    mp4Version = ssi.codeVersion(__file__, frames = framesDigest)
 
-    # Save 25fps MP4 ...
-    vname = pyguymer3.media.images2mp4(
-        frames,
-    )
-    shutil.move(vname, "studyBalticConcentration/trends.mp4")
+    # Check if the MP4 needs making ...
+    # NOTE: The MP4s were always made before the manifest existed, therefore
+    #       an existing MP4 which is not in the manifest is not adopted.
+    if not args.stream and ssi.needsMaking(manifest, "studyBalticConcentration/trends.mp4", [], mp4Version, adopt = False):
+        print("Making \"studyBalticConcentration/trends.mp4\" ...")
 
-    # **************************************************************************
+        # Save 25fps MP4 ...
+        vname = pyguymer3.media.images2mp4(
+            frames,
+            debug = mp4Debug,
+        )
+        shutil.move(vname, "studyBalticConcentration/trends.mp4")
 
-    # Set maximum sizes ...
-    # NOTE: By inspection, the PNG frames are 2,484 px wide.
-    maxSizes = [256, 512, 1024, 2048]                                           # [px]
+        # Record the MP4 in the manifest and save the manifest ...
+        ssi.recordArtefact(manifest, "studyBalticConcentration/trends.mp4", [], mp4Version)
+        ssi.saveManifest(manifest)
+
+    # **************************************************************************
 
     # Loop over maximum sizes ...
     for maxSize in maxSizes:
+        # Skip if the MP4s were made all at once or if the MP4 is up-to-date ...
+        if args.stream or not ssi.needsMaking(manifest, f"studyBalticConcentration/trends{maxSize:04d}px.mp4", [], mp4Version, adopt = False):
+            continue
+
         print(f"Making \"studyBalticConcentration/trends{maxSize:04d}px.mp4\" ...")
 
         # Save 25fps MP4 ...
         vname = pyguymer3.media.images2mp4(
             frames,
+                   debug = mp4Debug,
              screenWidth = maxSize,
             screenHeight = maxSize,
         )
         shutil.move(vname, f"studyBalticConcentration/trends{maxSize:04d}px.mp4")
+
+        # Record the MP4 in the manifest and save the manifest ...
+        ssi.recordArtefact(manifest, f"studyBalticConcentration/trends{maxSize:04d}px.mp4", [], mp4Version)
+        ssi.saveManifest(manifest)